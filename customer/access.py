@@ -0,0 +1,160 @@
+"""
+Resolve the (active client, client role) pair for the requesting user.
+
+Permissions and viewsets used to look up `ActiveClient` and `UserClientRole`
+independently, several times per request. Everything now goes through
+`resolve_client_role(request)`, which:
+
+- memoizes the result on the request, so a request resolves at most once
+- keeps a bounded, TTL-based cache across requests, keyed by user id
+- is invalidated from `customer.signals` when the underlying rows change, in every
+  worker through the `pms.invalidation` bus
+
+`ActiveClient.membership_version` is bumped on every membership change; it is
+what access tokens carrying client/role claims are checked against
+(see `pms.jwt_auth`).
+"""
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.db.models import F, OuterRef, Subquery
+
+from customer.models import ActiveClient, UserClientRole
+from pms import invalidation
+from utils.ttl_cache import TTLCache
+
+REQUEST_ATTR = '_client_role'
+
+CLIENT_ROLE_TOPIC = 'client_role'
+
+_NO_ACTIVE_CLIENT = object()
+
+role_cache = TTLCache(
+    maxsize=getattr(settings, 'CLIENT_ROLE_CACHE_MAX_ENTRIES', 10000),
+    ttl=getattr(settings, 'CLIENT_ROLE_CACHE_TTL', 60),
+    name='client_role',
+)
+
+membership_version_cache = TTLCache(
+    maxsize=getattr(settings, 'CLIENT_ROLE_CACHE_MAX_ENTRIES', 10000),
+    ttl=getattr(settings, 'MEMBERSHIP_VERSION_CACHE_TTL', 300),
+    name='membership_version',
+)
+
+
+class ClientRole(NamedTuple):
+    client_id: int
+    schema_name: str
+    role: Optional[str]
+    membership_version: int = 0
+
+
+def load_client_role(user_id) -> Optional[ClientRole]:
+    """
+    Fetch the user's active client and their role in it with a single query.
+    Returns None if the user has no active client.
+    """
+    role_subquery = UserClientRole.objects.filter(
+        user_id=OuterRef('user_id'),
+        client_id=OuterRef('client_id'),
+    ).values('role')[:1]
+
+    row = (
+        ActiveClient.objects.filter(user_id=user_id)
+        .annotate(role=Subquery(role_subquery))
+        .values('client_id', 'client__schema_name', 'role', 'membership_version')
+        .first()
+    )
+    if not row:
+        return None
+    return ClientRole(
+        row['client_id'],
+        row['client__schema_name'],
+        row['role'],
+        row['membership_version'],
+    )
+
+
+def get_client_role(user_id) -> Optional[ClientRole]:
+    """
+    Cached variant of `load_client_role`, shared across requests.
+    """
+    cached = role_cache.get(user_id)
+    if cached is None:
+        client_role = load_client_role(user_id)
+        role_cache.set(user_id, client_role if client_role else _NO_ACTIVE_CLIENT)
+        return client_role
+    return None if cached is _NO_ACTIVE_CLIENT else cached
+
+
+def resolve_client_role(request) -> Optional[ClientRole]:
+    """
+    Return the ClientRole for `request.user`, computing it at most once per request.
+    Anonymous users and users without an active client resolve to None.
+    """
+    if REQUEST_ATTR in request.__dict__:
+        return request.__dict__[REQUEST_ATTR]
+
+    user = getattr(request, 'user', None)
+    if not user or user.is_anonymous:
+        return None
+
+    client_role = get_client_role(user.pk)
+    setattr(request, REQUEST_ATTR, client_role)
+    return client_role
+
+
+def resolve_role(request) -> Optional[str]:
+    """
+    Shortcut returning only the role name ('owner', 'member', 'viewer') or None.
+    """
+    client_role = resolve_client_role(request)
+    return client_role.role if client_role else None
+
+
+def get_membership_version(user_id) -> Optional[int]:
+    """
+    Current membership version of the user's active client, or None if the
+    user has no active client. Cached, and cheaper than a full role lookup.
+    """
+    cached = membership_version_cache.get(user_id)
+    if cached is None:
+        version = (
+            ActiveClient.objects.filter(user_id=user_id)
+            .values_list('membership_version', flat=True)
+            .first()
+        )
+        membership_version_cache.set(user_id, _NO_ACTIVE_CLIENT if version is None else version)
+        return version
+    return None if cached is _NO_ACTIVE_CLIENT else cached
+
+
+def bump_membership_version(user_id) -> None:
+    """
+    Mark every token issued with the user's previous client/role claims as stale.
+    Uses update() so no ActiveClient signals are re-triggered.
+    """
+    ActiveClient.objects.filter(user_id=user_id).update(
+        membership_version=F('membership_version') + 1
+    )
+    invalidation.publish(CLIENT_ROLE_TOPIC, user_id)
+
+
+def invalidate_client_role(user_id) -> None:
+    """
+    Evict the user's cached role and membership version in this process only;
+    use `invalidation.publish(CLIENT_ROLE_TOPIC, user_id)` to reach every worker.
+    """
+    role_cache.delete(user_id)
+    membership_version_cache.delete(user_id)
+
+
+def _evict_client_roles(schema, user_id):
+    if user_id is None:
+        role_cache.clear()
+        membership_version_cache.clear()
+    else:
+        invalidate_client_role(user_id)
+
+
+invalidation.register(CLIENT_ROLE_TOPIC, _evict_client_roles)
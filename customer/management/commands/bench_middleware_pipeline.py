@@ -0,0 +1,81 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+
+# The stack before lean routes, minus tenant resolution (see bench_tenant_middleware)
+FULL_STACK = [
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'pms.middleware.DebugAuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+
+def build_chain(middleware_paths):
+    """
+    Wrap a trivial view in `middleware_paths`, outermost first, like BaseHandler does.
+    process_view hooks are collected and run before the view.
+    """
+    instances = []
+
+    def view(request):
+        for middleware in instances:
+            if hasattr(middleware, 'process_view'):
+                response = middleware.process_view(request, view, (), {})
+                if response is not None:
+                    return response
+        return HttpResponse('[]', content_type='application/json')
+
+    handler = view
+    for path in reversed(middleware_paths):
+        handler = import_string(path)(handler)
+        instances.insert(0, handler)
+    return handler
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark the per-request middleware overhead of the full Django stack "
+        "vs the current MIDDLEWARE setting (which skips layers on lean routes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/v1/projects/', help='Request path')
+        parser.add_argument('--host', default='localhost', help='Host header (must be in ALLOWED_HOSTS)')
+        parser.add_argument('--requests', type=int, default=20000, help='Requests per pipeline')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        iterations = options['requests']
+        factory = RequestFactory()
+
+        current = [
+            middleware for middleware in settings.MIDDLEWARE
+            if not middleware.endswith('TenantMainMiddleware')
+        ]
+
+        self.stdout.write(f'GET {path} {iterations} times per pipeline\n')
+
+        for label, middleware_paths in (
+            ('full stack', FULL_STACK),
+            ('MIDDLEWARE setting', current),
+        ):
+            chain = build_chain(middleware_paths)
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                request = factory.get(path, HTTP_HOST=options['host'])
+                request.COOKIES['access_token'] = 'bench'
+                chain(request)
+            elapsed = time.perf_counter() - started
+
+            self.stdout.write(f'{label:<20} {elapsed / iterations * 1e6:9.1f} us/request')
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django_tenants.middleware.main import TenantMainMiddleware
+
+from customer.models import Domain
+from pms.middleware import CachedTenantMainMiddleware, invalidate_tenant_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark the per-request overhead of tenant resolution: "
+        "django_tenants' TenantMainMiddleware vs pms.middleware.CachedTenantMainMiddleware."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', help='Hostname to resolve (defaults to the first Domain)')
+        parser.add_argument('--requests', type=int, default=5000, help='Requests per middleware')
+
+    def handle(self, *args, **options):
+        host = options['host']
+        if not host:
+            domain = Domain.objects.order_by('id').first()
+            if not domain:
+                raise CommandError('No Domain rows found, pass --host')
+            host = domain.domain
+
+        iterations = options['requests']
+        factory = RequestFactory()
+
+        self.stdout.write(f'Resolving "{host}" {iterations} times per middleware\n')
+
+        invalidate_tenant_cache()
+        for label, middleware_class in (
+            ('TenantMainMiddleware', TenantMainMiddleware),
+            ('CachedTenantMainMiddleware', CachedTenantMainMiddleware),
+        ):
+            middleware = middleware_class(lambda request: HttpResponse())
+
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    request = factory.get('/api/v1/projects/', HTTP_HOST=host)
+                    middleware(request)
+                elapsed = time.perf_counter() - started
+
+            self.stdout.write(
+                f'{label:<28} {elapsed / iterations * 1e6:9.1f} us/request   '
+                f'{len(ctx.captured_queries) / iterations:5.2f} queries/request'
+            )
+
+        connection.set_schema_to_public()
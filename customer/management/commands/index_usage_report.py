@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django_tenants.utils import get_public_schema_name
+
+from customer.models import Client
+
+USAGE_SQL = """
+    SELECT s.relname,
+           s.indexrelname,
+           s.idx_scan,
+           s.idx_tup_read,
+           pg_relation_size(s.indexrelid),
+           i.indisvalid
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.schemaname = %s
+    ORDER BY s.relname, s.idx_scan DESC, s.indexrelname
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Report index usage (scans, tuples read, size, validity) per tenant schema "
+        "from pg_stat_user_indexes. Counters accumulate since the last stats reset."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', action='append', help='Schema to report (repeatable, defaults to every tenant)')
+        parser.add_argument('--table', help='Only indexes of this table')
+        parser.add_argument('--unused', action='store_true', help='Only indexes that were never scanned')
+
+    def handle(self, *args, **options):
+        schemas = options['schema'] or list(
+            Client.objects.exclude(schema_name=get_public_schema_name())
+            .order_by('schema_name')
+            .values_list('schema_name', flat=True)
+        )
+        if not schemas:
+            raise CommandError('No tenant schemas found')
+
+        for schema in schemas:
+            with connection.cursor() as cursor:
+                cursor.execute(USAGE_SQL, [schema])
+                rows = cursor.fetchall()
+
+            if options['table']:
+                rows = [row for row in rows if row[0] == options['table']]
+            if options['unused']:
+                rows = [row for row in rows if not row[2]]
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n{schema}'))
+            if not rows:
+                self.stdout.write('  (no matching indexes)')
+                continue
+
+            self.stdout.write(f'  {"table":<34} {"index":<42} {"scans":>10} {"tuples read":>12} {"size":>10}')
+            for table, index, scans, tuples_read, size, is_valid in rows:
+                line = f'  {table:<34} {index:<42} {scans:>10} {tuples_read:>12} {size / 1024:>8.0f}kB'
+                if not is_valid:
+                    # left behind by an interrupted CREATE INDEX CONCURRENTLY
+                    line = self.style.ERROR(f'{line}  INVALID')
+                elif not scans:
+                    line = self.style.WARNING(line)
+                self.stdout.write(line)
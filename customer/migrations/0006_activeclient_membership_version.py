@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0005_remove_client_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activeclient',
+            name='membership_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
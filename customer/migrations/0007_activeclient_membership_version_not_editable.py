@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customer', '0006_activeclient_membership_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activeclient',
+            name='membership_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -18,6 +18,20 @@ class Domain(DomainMixin):
 class ActiveClient(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     client = models.ForeignKey(Client, on_delete=models.CASCADE)
+    # bumped whenever the user's active client or client roles change,
+    # so access tokens carrying client/role claims can be detected as stale.
+    # Only ever changed by customer.access.bump_membership_version()
+    membership_version = models.PositiveIntegerField(default=0, editable=False)
+
+    def save(self, *args, **kwargs):
+        # A full save of a stale instance must not roll the counter back to an
+        # already issued version; bump_membership_version() increments it in SQL
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'membership_version'
+            ]
+        super().save(*args, **kwargs)
 
 class UserClientRole(models.Model):
     ROLE_CHOICES = [
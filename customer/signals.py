@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from customer.access import CLIENT_ROLE_TOPIC, bump_membership_version
+from customer.models import ActiveClient, Client, Domain, UserClientRole
+from pms import invalidation
+from pms.middleware import TENANT_TOPIC
+
+
+@receiver(post_save, sender=ActiveClient)
+def active_client_saved(sender, instance, created, **kwargs):
+    """
+    Switching the active client makes tokens carrying the old client claims stale.
+    """
+    if created:
+        invalidation.publish(CLIENT_ROLE_TOPIC, instance.user_id)
+    else:
+        bump_membership_version(instance.user_id)
+
+
+@receiver(post_delete, sender=ActiveClient)
+def active_client_deleted(sender, instance, **kwargs):
+    invalidation.publish(CLIENT_ROLE_TOPIC, instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=UserClientRole)
+def client_role_changed(sender, instance, **kwargs):
+    """
+    Granting, changing or revoking a role invalidates the cached role and
+    every access token issued with the previous role claim.
+    """
+    bump_membership_version(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Domain)
+@receiver([post_save, post_delete], sender=Client)
+def tenant_changed(sender, instance, **kwargs):
+    invalidation.publish(TENANT_TOPIC)
@@ -6,15 +6,20 @@ from rest_framework.response import Response
 from rest_framework import viewsets
 from decimal import Decimal
 
+from project.models import Project
+from utils.conditional_get import conditional_on_tables
+from work_items.models import WorkItems
+
 
 class DashboardViewset(viewsets.ViewSet):
 
     @action(detail=False, methods=['get'])
+    @conditional_on_tables(Project, WorkItems)
     def dashboard_data(self, request):
         """
         Get comprehensive dashboard data with comparisons and trends
         """
-        today = timezone.now().date()
+        today = timezone.localdate()
         
         # Calculate date ranges
         current_month_start = today.replace(day=1)
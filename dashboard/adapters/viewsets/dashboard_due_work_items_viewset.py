@@ -2,15 +2,20 @@ from work_items.adapters.serializers.work_items_serializer import WorkItemsSeria
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.db.models import Q
-from datetime import date
+from django.utils import timezone
 from work_items.models import WorkItems, Status
+from project.models import Project
+from django.contrib.auth.models import User
+from user.models import UserProfile
+from utils.conditional_get import conditional_on_tables
 
 class DueTasksView(APIView):
     """
     API view to return all work items that are due until today (not completed)
     """
+    @conditional_on_tables(WorkItems, WorkItems.assigned_to.through, Project, User, UserProfile)
     def get(self, request):
-        today = date.today()
+        today = timezone.localdate()
         
         due_tasks = WorkItems.objects.filter(
             ~Q(status=Status.COMPLETED),
@@ -2,13 +2,16 @@ from django.shortcuts import render
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from work_items.models import WorkItems
+from project.models import Project
+from utils.conditional_get import conditional_on_tables
 from django.db.models import Count, Q, Case, When, Value, CharField
-from datetime import date
+from django.utils import timezone
 
 
 class WorkItemStatusDistribution(APIView):
+    @conditional_on_tables(WorkItems, Project)
     def get(self, request):
-        today = date.today()
+        today = timezone.localdate()
 
         # Include only work items whose project is NOT completed
         work_items = WorkItems.objects.filter(~Q(project__status='completed')).annotate(
@@ -34,6 +37,7 @@ class WorkItemStatusDistribution(APIView):
 
 
 class WorkItemPriorityDistribution(APIView):
+    @conditional_on_tables(WorkItems, Project)
     def get(self, request):
         # Only include work items whose project is NOT completed
         work_items = WorkItems.objects.filter(~Q(project__status='completed'))
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pms.settings')
 
 application = get_asgi_application()
+
+# Evict in-process caches when other workers publish invalidations
+from pms.invalidation import start_listener  # noqa: E402
+
+start_listener()
@@ -0,0 +1,183 @@
+"""
+Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+
+In-process caches (tenants, client roles, JWT users, Slack tokens, ...) live in
+every gunicorn/daphne worker. Model signals call `publish(topic, key)`, which:
+
+- evicts the key from this process's caches right away, through the handlers
+  registered for `topic`, and again once the transaction commits: requests
+  served by this process in between may re-cache the pre-commit state, and
+  this process ignores its own NOTIFY
+- sends a NOTIFY on CACHE_INVALIDATION_CHANNEL, tagged with the tenant schema.
+  NOTIFY is transactional, so other workers only hear about committed changes
+
+Each serving process runs one `InvalidationListener` thread (started from
+pms.wsgi / pms.asgi) that LISTENs on its own connection and dispatches incoming
+messages to the same handlers. A handler is called as `handler(schema, key)`;
+`key=None` means "drop everything", which is also sent to every handler whenever
+the listener (re)connects, since messages sent while it was away are lost.
+"""
+import json
+import logging
+import os
+import select
+import threading
+from collections import defaultdict
+from functools import partial
+from typing import Callable, Hashable, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# topic -> handlers called with (schema, key)
+_handlers = defaultdict(list)
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def bus_enabled() -> bool:
+    return getattr(settings, 'CACHE_INVALIDATION_BUS_ENABLED', False)
+
+
+def channel_name() -> str:
+    return getattr(settings, 'CACHE_INVALIDATION_CHANNEL', 'pms_cache_invalidation')
+
+
+def register(topic: str, handler: Callable[[Optional[str], Optional[Hashable]], None]) -> None:
+    """
+    Register `handler` to be called for every invalidation of `topic`, local or remote.
+    """
+    if handler not in _handlers[topic]:
+        _handlers[topic].append(handler)
+
+
+def dispatch(topic: str, schema: Optional[str], key) -> None:
+    for handler in _handlers.get(topic, ()):
+        try:
+            handler(schema, key)
+        except Exception:
+            logger.exception('Cache invalidation handler failed for topic "%s"', topic)
+
+
+def flush_all() -> None:
+    for topic in list(_handlers):
+        dispatch(topic, None, None)
+
+
+def publish(topic: str, key=None, schema: Optional[str] = None) -> None:
+    """
+    Invalidate `key` (JSON serializable, None for everything) of `topic` in every process.
+    `schema` defaults to the schema of the current connection.
+    """
+    if schema is None:
+        schema = getattr(connection, 'schema_name', None)
+
+    dispatch(topic, schema, key)
+    transaction.on_commit(partial(dispatch, topic, schema, key))
+
+    if not bus_enabled():
+        return
+
+    payload = json.dumps({'topic': topic, 'schema': schema, 'key': key, 'pid': os.getpid()})
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [channel_name(), payload])
+    except Exception:
+        # Other workers fall back to their cache TTLs
+        logger.exception('Could not publish cache invalidation for topic "%s"', topic)
+
+
+def handle_notification(payload: str) -> None:
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        logger.warning('Ignoring malformed cache invalidation payload: %r', payload)
+        return
+
+    if message.get('pid') == os.getpid():
+        # Already evicted locally by publish(), on commit included
+        return
+
+    dispatch(message.get('topic'), message.get('schema'), message.get('key'))
+
+
+class InvalidationListener(threading.Thread):
+    """
+    Daemon thread LISTENing on the invalidation channel with a dedicated
+    psycopg2 connection; reconnects with exponential backoff.
+    """
+
+    poll_timeout = 5  # seconds between checks of the stop flag
+    max_backoff = 30  # seconds
+
+    def __init__(self):
+        super().__init__(name='cache-invalidation-listener', daemon=True)
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self):
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                self.listen()
+                backoff = 1
+            except Exception:
+                logger.exception('Cache invalidation listener lost its connection, retrying in %ss', backoff)
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def connect(self):
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+        db = settings.DATABASES['default']
+        conn = psycopg2.connect(
+            dbname=db['NAME'],
+            user=db['USER'],
+            password=db['PASSWORD'],
+            host=db['HOST'],
+            port=db['PORT'],
+            application_name='pms-cache-invalidation',
+        )
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def listen(self):
+        conn = self.connect()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{channel_name()}"')
+
+            # Anything published while we were not listening is lost
+            flush_all()
+
+            while not self._stop_event.is_set():
+                if select.select([conn], [], [], self.poll_timeout) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    handle_notification(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+
+def start_listener() -> Optional[InvalidationListener]:
+    """
+    Start this process's listener once; a no-op when the bus is disabled.
+    Safe to call after a fork: the listener is restarted in the child.
+    """
+    global _listener
+
+    if not bus_enabled():
+        return None
+
+    with _listener_lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = InvalidationListener()
+            _listener.start()
+    return _listener
@@ -1,19 +1,106 @@
 """
 Custom JWT authentication that reads tokens from cookies instead of Authorization headers.
 This is more secure as it prevents XSS attacks from stealing tokens.
+
+When `JWT_CLIENT_CLAIMS` is enabled, access tokens also carry the user's active
+client schema, client role and membership version. Authentication then primes the
+per-request client role from those claims so permission classes and querysets
+need no role lookup; a cached membership version check rejects stale tokens.
+
+When `JWT_USER_CACHE_ENABLED` is set, users resolved from tokens are kept in a
+bounded in-process LRU+TTL cache keyed by (user id, token jti), so the per-request
+`auth_user` SELECT is skipped. `user.signals` invalidates it on User/UserProfile changes,
+in every worker through the `pms.invalidation` bus.
 """
 
+import copy
+
+from django.conf import settings
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 from django.http import HttpRequest
 from typing import Tuple, Optional
 
+from customer.access import REQUEST_ATTR, ClientRole, get_membership_version
+from pms import invalidation
+from utils.ttl_cache import TTLCache
+
+CLIENT_ID_CLAIM = 'client_id'
+CLIENT_SCHEMA_CLAIM = 'client_schema'
+ROLE_CLAIM = 'role'
+MEMBERSHIP_VERSION_CLAIM = 'mv'
+
+USER_TOPIC = 'user'
+
+user_cache = TTLCache(
+    maxsize=getattr(settings, 'JWT_USER_CACHE_MAX_ENTRIES', 5000),
+    ttl=getattr(settings, 'JWT_USER_CACHE_TTL', 60),
+    name='jwt_user',
+)
+
+
+def client_claims_enabled() -> bool:
+    return getattr(settings, 'JWT_CLIENT_CLAIMS', False)
+
+
+def add_client_claims(token, client_role: Optional[ClientRole]):
+    """
+    Sign the active client and role into `token` (an AccessToken).
+    No-op unless `JWT_CLIENT_CLAIMS` is enabled or when there is no active client.
+    """
+    if not client_claims_enabled() or client_role is None:
+        return token
+
+    token[CLIENT_ID_CLAIM] = client_role.client_id
+    token[CLIENT_SCHEMA_CLAIM] = client_role.schema_name
+    token[ROLE_CLAIM] = client_role.role
+    token[MEMBERSHIP_VERSION_CLAIM] = client_role.membership_version
+    return token
+
+
+def client_role_from_claims(validated_token) -> Optional[ClientRole]:
+    """
+    Rebuild the ClientRole signed into the token, or None for tokens without claims.
+    """
+    if MEMBERSHIP_VERSION_CLAIM not in validated_token:
+        return None
+
+    return ClientRole(
+        validated_token.get(CLIENT_ID_CLAIM),
+        validated_token.get(CLIENT_SCHEMA_CLAIM),
+        validated_token.get(ROLE_CLAIM),
+        validated_token[MEMBERSHIP_VERSION_CLAIM],
+    )
+
+
+def user_cache_enabled() -> bool:
+    return getattr(settings, 'JWT_USER_CACHE_ENABLED', False)
+
+
+def invalidate_cached_user(user_id) -> None:
+    """
+    Drop every cached entry of the user, whatever token it was cached under.
+    """
+    user_id = str(user_id)
+    user_cache.delete_where(lambda key: key[0] == user_id)
+
+
+def _evict_users(schema, user_id):
+    if user_id is None:
+        user_cache.clear()
+    else:
+        invalidate_cached_user(user_id)
+
+
+invalidation.register(USER_TOPIC, _evict_users)
+
 
 class CookieJWTAuthentication(JWTAuthentication):
     """
     Custom JWT authentication that reads access tokens from HttpOnly cookies.
     Falls back to Authorization header for backward compatibility (e.g., testing, mobile apps).
-    
+
     Cookie tokens are more secure because:
     - They cannot be accessed by JavaScript (HttpOnly flag)
     - CSRF protection is built-in (SameSite flag)
@@ -23,10 +110,10 @@ class CookieJWTAuthentication(JWTAuthentication):
     def authenticate(self, request: HttpRequest) -> Optional[Tuple]:
         """
         Authenticate by looking for JWT token in cookies first, then headers.
-        
+
         Args:
             request: The HTTP request
-            
+
         Returns:
             A tuple of (user, validated_token) if authentication succeeds
             None if no credentials are provided
@@ -34,11 +121,14 @@ class CookieJWTAuthentication(JWTAuthentication):
         """
         # Try to get token from cookies first (secure method)
         access_token = request.COOKIES.get('access_token')
-        
+
         if access_token is None:
             # Fall back to Authorization header for backward compatibility
             # This allows testing tools and mobile apps to work
-            return super().authenticate(request)
+            result = super().authenticate(request)
+            if result is not None:
+                self.apply_client_claims(request, result[0], result[1])
+            return result
 
         # Validate the token
         try:
@@ -47,7 +137,46 @@ class CookieJWTAuthentication(JWTAuthentication):
             # Token is invalid, re-raise the exception
             raise
 
-        return self.get_user(validated_token), validated_token
+        user = self.get_user(validated_token)
+        self.apply_client_claims(request, user, validated_token)
+        return user, validated_token
+
+    def get_user(self, validated_token):
+        """
+        Resolve the token's user, going through the user cache when it is enabled.
+        A copy is returned so per-request mutations never leak into the cache.
+        """
+        if not user_cache_enabled():
+            return super().get_user(validated_token)
+
+        key = (
+            str(validated_token.get(api_settings.USER_ID_CLAIM)),
+            validated_token.get(api_settings.JTI_CLAIM),
+        )
+        user = user_cache.get(key)
+        if user is None:
+            # Raises for unknown or inactive users, which are never cached
+            user = super().get_user(validated_token)
+            user_cache.set(key, user)
+        return copy.copy(user)
+
+    def apply_client_claims(self, request, user, validated_token) -> None:
+        """
+        Prime the request's client role from token claims, after checking the
+        claims were issued against the user's current membership version.
+        """
+        if not client_claims_enabled():
+            return
+
+        client_role = client_role_from_claims(validated_token)
+        if client_role is None:
+            # Token issued before claims were enabled; roles resolve from the DB
+            return
+
+        if client_role.membership_version != get_membership_version(user.pk):
+            raise InvalidToken('Token client membership is stale, please refresh.')
+
+        setattr(request, REQUEST_ATTR, client_role)
 
     def authenticate_header(self, request: HttpRequest) -> str:
         """
@@ -1,10 +1,129 @@
 """
-Debug middleware to log authentication and cookie information.
+Project middleware:
+
+- CachedTenantMainMiddleware: TenantMainMiddleware with an in-process hostname -> tenant cache
+- PathAware*Middleware: stock Django layers that are skipped on lean (API/webhook) routes
+- DebugAuthenticationMiddleware: logs authentication and cookie information
 """
+import copy
 import logging
 
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from django_tenants.middleware.main import TenantMainMiddleware
+
+from pms import invalidation
+
+from utils.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+_UNKNOWN_HOST = object()
+
+TENANT_TOPIC = 'tenant'
+
+tenant_cache = TTLCache(
+    maxsize=getattr(settings, 'TENANT_CACHE_MAX_ENTRIES', 1000),
+    ttl=getattr(settings, 'TENANT_CACHE_TTL', 300),
+    name='tenant',
+)
+
+
+def invalidate_tenant_cache() -> None:
+    """
+    Forget every cached hostname. Domains and clients change rarely, so a
+    full clear keeps invalidation trivially correct.
+    """
+    tenant_cache.clear()
+
+
+invalidation.register(TENANT_TOPIC, lambda schema, key: invalidate_tenant_cache())
+
+
+class CachedTenantMainMiddleware(TenantMainMiddleware):
+    """
+    TenantMainMiddleware that caches hostname -> tenant resolution in memory.
+
+    - known hosts are cached for TENANT_CACHE_TTL seconds
+    - unknown hosts are negatively cached for TENANT_CACHE_NEGATIVE_TTL seconds,
+      so probing random subdomains does not hit the database on every request
+    - customer.signals clears the cache when a Domain or Client is saved or deleted
+    """
+
+    def get_tenant(self, domain_model, hostname):
+        cached = tenant_cache.get(hostname)
+
+        if cached is _UNKNOWN_HOST:
+            raise domain_model.DoesNotExist(f'No domain for hostname "{hostname}" (cached)')
+
+        if cached is None:
+            try:
+                cached = super().get_tenant(domain_model, hostname)
+            except domain_model.DoesNotExist:
+                tenant_cache.set(
+                    hostname,
+                    _UNKNOWN_HOST,
+                    ttl=getattr(settings, 'TENANT_CACHE_NEGATIVE_TTL', 30),
+                )
+                raise
+            tenant_cache.set(hostname, cached)
+
+        # process_request() sets attributes (domain_url) on the tenant, keep the cached one pristine
+        return copy.copy(cached)
+
+
+def is_lean_route(request) -> bool:
+    """
+    API and webhook routes authenticate with CookieJWTAuthentication (DRF views are
+    csrf_exempt) and never use sessions, messages or framing, so the session, CSRF,
+    auth, messages and X-Frame-Options layers are skipped for them.
+    Everything else (/admin/, /summernote/, /swagger/) keeps the full stack.
+    """
+    return request.path_info.startswith(
+        tuple(getattr(settings, 'LEAN_MIDDLEWARE_PATH_PREFIXES', ()))
+    )
+
+
+class LeanRouteSkipMixin:
+    """
+    Dispatches around the wrapped middleware on lean routes.
+    Works in sync and async mode: get_response returns a coroutine when async.
+    """
+
+    def __call__(self, request):
+        if is_lean_route(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class PathAwareSessionMiddleware(LeanRouteSkipMixin, SessionMiddleware):
+    pass
+
+
+class PathAwareCsrfViewMiddleware(LeanRouteSkipMixin, CsrfViewMiddleware):
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        # the handler calls process_view hooks directly, outside __call__
+        if is_lean_route(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class PathAwareAuthenticationMiddleware(LeanRouteSkipMixin, AuthenticationMiddleware):
+    pass
+
+
+class PathAwareMessageMiddleware(LeanRouteSkipMixin, MessageMiddleware):
+    pass
+
+
+class PathAwareXFrameOptionsMiddleware(LeanRouteSkipMixin, XFrameOptionsMiddleware):
+    pass
+
 
 class DebugAuthenticationMiddleware:
     """
@@ -16,6 +135,10 @@ class DebugAuthenticationMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
+        # Lean routes have no session user; loading it here would defeat the point
+        if is_lean_route(request):
+            return self.get_response(request)
+
         # Log cookie presence for authenticated endpoints
         if 'my-client-users' in request.path or 'projects' in request.path:
             access_token = request.COOKIES.get('access_token')
@@ -102,6 +102,15 @@ SIMPLE_JWT = {
     "AUTH_REFRESH_COOKIE_SAMESITE": "Lax",
 }
 
+# Sign the active client schema, client role and membership version into access
+# tokens so permission checks can authorize from claims (see pms.jwt_auth).
+JWT_CLIENT_CLAIMS = False
+
+# Cache users resolved from access tokens in-process (see pms.jwt_auth)
+JWT_USER_CACHE_ENABLED = False
+JWT_USER_CACHE_TTL = 60  # seconds
+JWT_USER_CACHE_MAX_ENTRIES = 5000
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'pms.jwt_auth.CookieJWTAuthentication',  # Use custom cookie-based JWT auth
@@ -140,6 +149,7 @@ SHARED_APPS = (
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_summernote',
     "drf_spectacular",
     "drf_spectacular_sidecar",  # optional for UI assets
@@ -170,17 +180,23 @@ TENANT_DOMAIN_MODEL = "customer.Domain"  # app.Model
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
-    'django_tenants.middleware.main.TenantMainMiddleware',
+    'pms.middleware.CachedTenantMainMiddleware',  # TenantMainMiddleware + hostname cache
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    # PathAware* layers are skipped on LEAN_MIDDLEWARE_PATH_PREFIXES routes
+    'pms.middleware.PathAwareSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'pms.middleware.PathAwareCsrfViewMiddleware',
+    'pms.middleware.PathAwareAuthenticationMiddleware',
     'pms.middleware.DebugAuthenticationMiddleware',  # Debug logging
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'pms.middleware.PathAwareMessageMiddleware',
+    'pms.middleware.PathAwareXFrameOptionsMiddleware',
 ]
 
+# API and webhook routes only need CORS, tenant, security and common middleware
+LEAN_MIDDLEWARE_PATH_PREFIXES = (
+    '/api/',
+)
+
 ROOT_URLCONF = 'pms.urls'
 
 TEMPLATES = [
@@ -265,3 +281,59 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+
+# In-process caches
+# Cross-request cache of each user's (active client, client role) pair,
+# see customer.access. Entries are also invalidated from model signals.
+CLIENT_ROLE_CACHE_TTL = 60  # seconds
+CLIENT_ROLE_CACHE_MAX_ENTRIES = 10000
+# How long a membership version (checked against JWT_CLIENT_CLAIMS tokens) is cached
+MEMBERSHIP_VERSION_CACHE_TTL = 300  # seconds
+# Hostname -> tenant resolution cache used by pms.middleware.CachedTenantMainMiddleware
+TENANT_CACHE_TTL = 300  # seconds
+TENANT_CACHE_NEGATIVE_TTL = 30  # seconds, for hostnames without a Domain
+TENANT_CACHE_MAX_ENTRIES = 1000
+# Per-tenant SlackToken cache used by utils.slack_notification
+SLACK_TOKEN_CACHE_TTL = 300  # seconds
+
+# Cross-worker invalidation of the caches above over Postgres LISTEN/NOTIFY,
+# see pms.invalidation. The listener thread runs in wsgi/asgi processes only.
+CACHE_INVALIDATION_BUS_ENABLED = True
+CACHE_INVALIDATION_CHANNEL = 'pms_cache_invalidation'
+
+# Per-process caches; the bus above keeps versioned entries consistent across workers.
+# 'querysets' holds list results, see utils.queryset_cache (views opt in with cache_ttl).
+# 'fragments' holds serialized list rows, see utils.fragment_cache.
+# The ETags of utils.conditional_get hash the table version tokens kept in 'querysets',
+# so they only validate across workers when that alias is a shared backend (e.g. Redis).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pms-default',
+    },
+    'querysets': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pms-querysets',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+    'fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pms-fragments',
+        'OPTIONS': {'MAX_ENTRIES': 50000},
+    },
+}
+QUERYSET_CACHE_ENABLED = True
+QUERYSET_CACHE_ALIAS = 'querysets'
+# Lifetime of the per-table version tokens: the most a worker that missed an
+# invalidation keeps serving cached lists and 304s
+TABLE_VERSION_TTL = 300
+FRAGMENT_CACHE_ENABLED = True
+FRAGMENT_CACHE_ALIAS = 'fragments'
+FRAGMENT_CACHE_TTL = 3600
+
+# Pagination totals (utils.custom_paginator): 'exact' COUNT(*), 'estimated' planner
+# estimate above the threshold, or 'capped' at PAGINATION_COUNT_CAP rows.
+# Views may override with a `count_strategy` attribute.
+PAGINATION_COUNT_STRATEGY = 'exact'
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = 10000
+PAGINATION_COUNT_CAP = 10000
@@ -2,6 +2,8 @@ from rest_framework import serializers
 from project.models import Project, ProjectMembers
 from django.contrib.auth.models import User
 from user.models import UserProfile
+from utils.fragment_cache import FragmentCachedListSerializer
+from utils.includes import SparseFieldsMixin
 
 
 class ProjectUserProfileSerializer(serializers.ModelSerializer):
@@ -38,12 +40,26 @@ class ProjectMemberSerializer(serializers.ModelSerializer):
         model = ProjectMembers
         fields = ('user', 'role')
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     team_members = ProjectMemberSerializer(source='projectmembers_set', many=True, read_only=True)
 
     class Meta:
         model = Project
-        fields = '__all__'
+        # internal sort key / derived description columns / search index
+        exclude = ('priority_rank', 'description_html', 'description_text', 'search_vector')
+        # Lists reuse cached rows, see utils.fragment_cache
+        list_serializer_class = FragmentCachedListSerializer
+        fragment_models = (ProjectMembers, User, UserProfile)
+        fragment_prefetch = {'team_members': ('projectmembers_set__user__profile',)}
+
+class ProjectSummarySerializer(ProjectSerializer):
+    """
+    List representation: the plain-text `description_excerpt` instead of the HTML
+    `description`, which ProjectViewSet defers (use ?include=description for it).
+    """
+
+    class Meta(ProjectSerializer.Meta):
+        exclude = ('priority_rank', 'description_html', 'description_text', 'search_vector', 'description')
 
 class ProjectWriteSerializer(serializers.ModelSerializer):
     team_members = serializers.ListField(
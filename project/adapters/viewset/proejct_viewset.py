@@ -1,18 +1,44 @@
 from project.permission import ProjectAccessPermission
-from customer.models import ActiveClient, UserClientRole
-from project.models import Project
-from rest_framework import viewsets, filters
+from customer.access import resolve_role
+from project.models import Project, ProjectMembers
+from rest_framework import viewsets
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework import status
 from django_filters.rest_framework import DjangoFilterBackend
-from project.adapters.serializers.project_serializer import ProjectSerializer, OnGoingProjectSerializer, ProjectWriteSerializer
+from project.adapters.serializers.project_serializer import ProjectSerializer, ProjectSummarySerializer, OnGoingProjectSerializer, ProjectWriteSerializer
 from utils.custom_paginator import CustomPaginator
+from utils.ordering_filter import MappedOrderingFilter
+from utils.queryset_cache import CachedListMixin
+from utils.conditional_get import ConditionalGetMixin
+from utils.columnar_renderer import ColumnarJSONRenderer
+from utils.includes import QueryFieldsMixin, field_requested, requested_fields, requested_includes
+from utils.full_text_search import FullTextSearchFilter
+from django.contrib.auth.models import User
+from user.models import UserProfile
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.decorators import action
+from django.db.models import Exists, OuterRef
 from pms.jwt_auth import CookieJWTAuthentication
 from utils.slack_notification import notify_project_update
 
-class ProjectViewSet(viewsets.ModelViewSet):
+# Concrete columns ?fields= can select on list responses
+PROJECT_COLUMNS = {
+    field.name for field in Project._meta.concrete_fields
+    if not field.generated and field.name != "description"
+}
+
+
+def membership_exists(user):
+    """
+    EXISTS subquery flagging projects `user` is a member of.
+    Annotated as `is_member` so ProjectAccessPermission needs no extra query,
+    and filtered on to scope member/viewer lists without a join + DISTINCT.
+    """
+    return Exists(ProjectMembers.objects.filter(project_id=OuterRef("pk"), user_id=user.pk))
+
+
+class ProjectViewSet(QueryFieldsMixin, ConditionalGetMixin, CachedListMixin, viewsets.ModelViewSet):
     """
     Projects API with:
     - cookie JWT auth
@@ -20,28 +46,34 @@ class ProjectViewSet(viewsets.ModelViewSet):
     - role-based scoping in get_queryset()
     - object-level permissions via ProjectAccessPermission
     - read/write serializer switching
+    - cached list responses (see utils.queryset_cache)
+    - ETag / 304 on list and retrieve (see utils.conditional_get)
+    - lists defer the HTML description and return `description_excerpt`
+      (?include=description for the full HTML)
+    - ?fields=a,b trims the response, and skips the columns and prefetches
+      of dropped fields; unknown fields or includes are a 400
+    - ?search= is answered from the GIN-indexed `search_vector` (see utils.full_text_search)
     """
     serializer_class = ProjectSerializer
+    include_options = ("description",)
     pagination_class = CustomPaginator
     permission_classes = [IsAuthenticated, ProjectAccessPermission]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, MappedOrderingFilter]
     filterset_fields = ["status", "priority"]
     search_fields = ["name", "description"]
+    search_vector_field = "search_vector"
     ordering_fields = ["due_date", "created_at", "priority"]
+    ordering_field_map = {"priority": "priority_rank"}
     authentication_classes = [CookieJWTAuthentication]
+    cache_models = (Project, ProjectMembers, User, UserProfile)
+    cache_ttl = 60
+    # ?format=columnar, see utils.columnar_renderer
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+    columnar_references = {"team_members.user": "users"}
 
     def get_queryset(self):
         user = self.request.user
-
-        active = ActiveClient.objects.select_related("client").filter(user=user).first()
-        if not active:
-            return Project.objects.none()
-
-        role = (
-            UserClientRole.objects.filter(user=user, client=active.client)
-            .values_list("role", flat=True)
-            .first()
-        )
+        role = resolve_role(self.request)
 
         # No role => no access
         if not role:
@@ -50,19 +82,35 @@ class ProjectViewSet(viewsets.ModelViewSet):
         qs = Project.objects.all()
 
         if role in ("member", "viewer"):
-            qs = qs.filter(projectmembers__user=user)
-
-        # Performance (optional but recommended if you return team_members frequently)
-        qs = qs.prefetch_related(
-            "projectmembers_set__user",
-            "projectmembers_set__user__profile",  # adjust if your related_name differs
-        )
-
-        return qs.distinct().order_by("-id")
+            qs = qs.annotate(is_member=membership_exists(user)).filter(is_member=True)
+
+        # Lists prefetch team members for fragment cache misses only
+        if self.action != "list" and field_requested(self.request, "team_members"):
+            qs = qs.prefetch_related(
+                "projectmembers_set__user",
+                "projectmembers_set__user__profile",  # adjust if your related_name differs
+            )
+
+        # The tsvector is only read by ?search= filtering
+        qs = qs.defer("search_vector")
+        if self.lists_summaries():
+            qs = qs.defer("description")
+            fields = requested_fields(self.request)
+            if fields is not None:
+                # id and updated_at key the fragment cache
+                columns = {"id", "updated_at"} | (fields & PROJECT_COLUMNS)
+                qs = qs.only(*columns)
+
+        return qs.order_by("-id")
+
+    def lists_summaries(self):
+        return self.action == "list" and "description" not in requested_includes(self.request)
 
     def get_serializer_class(self):
         if self.action in ("create", "update", "partial_update"):
             return ProjectWriteSerializer
+        if self.lists_summaries():
+            return ProjectSummarySerializer
         return ProjectSerializer
 
     def create(self, request, *args, **kwargs):
@@ -85,6 +133,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
         tracked_fields = ['name', 'status', 'priority', 'due_date', 'description']
         for field in tracked_fields:
             old_values[field] = getattr(instance, field)
+        # Slack shows descriptions as their stored plain text
+        old_description_text = instance.description_text
         
         # Use write serializer for validation and saving
         write_serializer = self.get_serializer(instance, data=request.data, partial=partial)
@@ -97,6 +147,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
             new_value = getattr(instance, field)
             old_value = old_values[field]
             if old_value != new_value:
+                if field == 'description':
+                    old_value, new_value = old_description_text, instance.description_text
                 changes[field] = (str(old_value) if old_value else 'None', str(new_value) if new_value else 'None')
         
         if changes and instance.slack_channels.exists():
@@ -106,7 +158,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         read_serializer = ProjectSerializer(instance, context={'request': request})
         return Response(read_serializer.data)
 
-class OngoingProjectViewSet(viewsets.ModelViewSet):
+class OngoingProjectViewSet(CachedListMixin, viewsets.ModelViewSet):
     """
     Ongoing projects (status='active') with role-based scoping.
     Mirrors `ProjectViewSet` access rules so member/viewer roles only see assigned projects.
@@ -115,19 +167,12 @@ class OngoingProjectViewSet(viewsets.ModelViewSet):
     pagination_class = None
     permission_classes = [IsAuthenticated, ProjectAccessPermission]
     authentication_classes = [CookieJWTAuthentication]
+    cache_models = (Project, ProjectMembers)
+    cache_ttl = 120
 
     def get_queryset(self):
         user = self.request.user
-
-        active = ActiveClient.objects.select_related("client").filter(user=user).first()
-        if not active:
-            return Project.objects.none()
-
-        role = (
-            UserClientRole.objects.filter(user=user, client=active.client)
-            .values_list("role", flat=True)
-            .first()
-        )
+        role = resolve_role(self.request)
 
         if not role:
             return Project.objects.none()
@@ -135,12 +180,12 @@ class OngoingProjectViewSet(viewsets.ModelViewSet):
         qs = Project.objects.filter(status="active")
 
         if role in ("member", "viewer"):
-            qs = qs.filter(projectmembers__user=user)
+            qs = qs.annotate(is_member=membership_exists(user)).filter(is_member=True)
 
-        qs = qs.prefetch_related(
-            "projectmembers_set__user",
-            "projectmembers_set__user__profile",
-        )
+        # Lists (OnGoingProjectSerializer) only need id and name; detail and
+        # write actions load every column instead of one query per deferred field
+        if self.action == "list":
+            qs = qs.only("id", "name")
 
-        return qs.distinct().order_by("-id")
+        return qs.order_by("-id")
 
@@ -6,11 +6,13 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.settings import api_settings
 
 from work_items.models import WorkItems, Status
 from project.models import Project, ProjectActivityLog
 from project.adapters.serializers.project_activity_log_serializer import ProjectActivityLogSerializer
 from utils.custom_paginator import CustomPaginator
+from utils.columnar_renderer import ColumnarJSONRenderer
 from pms.jwt_auth import CookieJWTAuthentication
 
 logger = logging.getLogger(__name__)
@@ -78,17 +80,22 @@ class ProjectActivityLogViewSet(viewsets.ModelViewSet):
     """
     serializer_class = ProjectActivityLogSerializer
     pagination_class = CustomPaginator
+    cursor_ordering = ("-created_at", "-id")
+    count_strategy = "estimated"
     permission_classes = [IsAuthenticated]
     authentication_classes = [CookieJWTAuthentication]
+    # ?format=columnar, see utils.columnar_renderer
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+    columnar_flat_references = {"project_id": ("projects", {"project_name": "name"})}
 
     def get_queryset(self):
-        return ProjectActivityLog.objects.all().order_by("-created_at")
+        return ProjectActivityLog.objects.defer("search_vector").order_by("-created_at")
 
     @action(detail=False, methods=["get"], url_path="by-project/(?P<project_id>[^/.]+)")
     def get_activity_by_project_id(self, request, project_id=None):
         queryset = ProjectActivityLog.objects.filter(
             project__id=project_id
-        ).order_by("-created_at")
+        ).defer("search_vector").order_by("-created_at")
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -0,0 +1,123 @@
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from customer.access import resolve_role
+from pms.jwt_auth import CookieJWTAuthentication
+from project.adapters.viewset.proejct_viewset import membership_exists
+from project.models import Project, ProjectActivityLog, ProjectMembers
+from utils.full_text_search import build_search_query, rank
+from work_items.adapters.viewset.work_items_viewset import visibility_flags
+from work_items.models import WorkItems
+
+SEARCH_TYPES = ("project", "work_item", "activity")
+
+
+class SearchView(APIView):
+    """
+    Ranked full-text search across projects, work items and commit activity.
+
+    GET /api/v1/search/?q=<text>[&types=project,work_item,activity][&limit=20]
+
+    Every word must match and the last one matches as a prefix. Each type is
+    answered from its GIN-indexed `search_vector`, scoped like its list
+    endpoint (members/viewers only see their projects and work items), and the
+    results are merged by rank.
+    """
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    default_limit = 20
+    max_limit = 50
+
+    def get(self, request):
+        query = build_search_query(request.query_params.get("q", ""))
+        role = resolve_role(request)
+        if query is None or not role:
+            return Response({"results": []})
+
+        types = [
+            search_type for search_type in request.query_params.get("types", "").split(",")
+            if search_type in SEARCH_TYPES
+        ] or SEARCH_TYPES
+        limit = self.get_limit(request)
+        scoped = role in ("member", "viewer")
+
+        results = []
+        for search_type in types:
+            results.extend(getattr(self, f"search_{search_type}")(query, request.user, scoped, limit))
+
+        results.sort(key=lambda result: result["rank"], reverse=True)
+        return Response({"results": results[:limit]})
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    @staticmethod
+    def ranked(queryset, query, limit, *fields):
+        return queryset.filter(search_vector=query).annotate(
+            rank=rank(query)
+        ).order_by("-rank", "-id").values(*fields, "rank")[:limit]
+
+    def search_project(self, query, user, scoped, limit):
+        qs = Project.objects.all()
+        if scoped:
+            qs = qs.annotate(is_member=membership_exists(user)).filter(is_member=True)
+
+        return [
+            {
+                "type": "project",
+                "id": row["id"],
+                "title": row["name"],
+                "snippet": row["description_excerpt"],
+                "project_id": row["id"],
+                "rank": row["rank"],
+            }
+            for row in self.ranked(qs, query, limit, "id", "name", "description_excerpt")
+        ]
+
+    def search_work_item(self, query, user, scoped, limit):
+        qs = WorkItems.objects.all()
+        if scoped:
+            qs = qs.annotate(**visibility_flags(user)).filter(
+                Q(is_assigned=True) | Q(in_project=True)
+            )
+
+        return [
+            {
+                "type": "work_item",
+                "id": row["id"],
+                "title": row["title"],
+                "snippet": row["description_excerpt"],
+                "project_id": row["project_id"],
+                "rank": row["rank"],
+            }
+            for row in self.ranked(qs, query, limit, "id", "title", "description_excerpt", "project_id")
+        ]
+
+    def search_activity(self, query, user, scoped, limit):
+        qs = ProjectActivityLog.objects.annotate(
+            commit_message=KeyTextTransform("message", KeyTransform("head_commit", "activity")),
+            branch=KeyTextTransform("branch", "activity"),
+        )
+        if scoped:
+            qs = qs.filter(
+                Exists(ProjectMembers.objects.filter(project_id=OuterRef("project_id"), user_id=user.pk))
+            )
+
+        return [
+            {
+                "type": "activity",
+                "id": row["id"],
+                "title": (row["commit_message"] or "").split("\n", 1)[0],
+                "snippet": row["branch"] or "",
+                "project_id": row["project_id"],
+                "rank": row["rank"],
+            }
+            for row in self.ranked(qs, query, limit, "id", "commit_message", "branch", "project_id")
+        ]
@@ -0,0 +1,82 @@
+from django.contrib.auth.models import User
+from django.db.models import Exists, OuterRef, Q
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from customer.access import resolve_client_role
+from customer.models import UserClientRole
+from pms.jwt_auth import CookieJWTAuthentication
+from project.adapters.viewset.proejct_viewset import membership_exists
+from project.models import Project
+from utils.typeahead import typeahead
+from work_items.adapters.viewset.work_items_viewset import visibility_flags
+from work_items.models import WorkItems
+
+TYPEAHEAD_TYPES = ("project", "work_item", "user")
+
+
+class TypeaheadView(APIView):
+    """
+    Ranked top-N suggestions for pickers, instead of loading whole collections.
+
+    GET /api/v1/typeahead/?q=<text>[&types=project,work_item,user][&limit=8]
+
+    Matches project names, work item titles and the username, email and names
+    of users in the active client by prefix and by trigram similarity (see
+    utils.typeahead). Projects and work items are scoped like their list
+    endpoints. Returns `{"<type>": [...]}` for each requested type.
+    """
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    default_limit = 8
+    max_limit = 25
+
+    def get(self, request):
+        term = request.query_params.get("q", "").strip()
+        client_role = resolve_client_role(request)
+        types = [
+            suggestion_type for suggestion_type in request.query_params.get("types", "").split(",")
+            if suggestion_type in TYPEAHEAD_TYPES
+        ] or TYPEAHEAD_TYPES
+
+        if not term or not client_role or not client_role.role:
+            return Response({suggestion_type: [] for suggestion_type in types})
+
+        limit = self.get_limit(request)
+        scoped = client_role.role in ("member", "viewer")
+        return Response({
+            suggestion_type: list(
+                getattr(self, f"suggest_{suggestion_type}")(term, request.user, client_role, scoped)[:limit]
+            )
+            for suggestion_type in types
+        })
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def suggest_project(self, term, user, client_role, scoped):
+        qs = Project.objects.all()
+        if scoped:
+            qs = qs.annotate(is_member=membership_exists(user)).filter(is_member=True)
+        return typeahead(qs, ["name"], term).values("id", "name", "status")
+
+    def suggest_work_item(self, term, user, client_role, scoped):
+        qs = WorkItems.objects.all()
+        if scoped:
+            qs = qs.annotate(**visibility_flags(user)).filter(
+                Q(is_assigned=True) | Q(in_project=True)
+            )
+        return typeahead(qs, ["title"], term).values("id", "title", "status", "project_id")
+
+    def suggest_user(self, term, user, client_role, scoped):
+        qs = User.objects.filter(
+            Exists(UserClientRole.objects.filter(user_id=OuterRef("pk"), client_id=client_role.client_id))
+        )
+        return typeahead(qs, ["username", "email", "first_name", "last_name"], term).values(
+            "id", "username", "email", "first_name", "last_name"
+        )
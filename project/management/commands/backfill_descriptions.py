@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from customer.models import Client
+from project.models import Project
+from utils.description import DERIVED_FIELDS, update_description_fields
+from work_items.models import WorkItems
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the sanitized HTML, plain text and excerpt columns derived from "
+        "Project and WorkItems descriptions, in batches, for one or every tenant schema."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', action='append', help='Schema to backfill (repeatable, defaults to every tenant)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per bulk UPDATE')
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between batches')
+        parser.add_argument('--missing-only', action='store_true', help='Only rows whose plain text is still empty')
+
+    def handle(self, *args, **options):
+        schemas = options['schema'] or list(
+            Client.objects.exclude(schema_name=get_public_schema_name())
+            .order_by('schema_name')
+            .values_list('schema_name', flat=True)
+        )
+        if not schemas:
+            raise CommandError('No tenant schemas found')
+
+        for schema in schemas:
+            with schema_context(schema):
+                for model in (Project, WorkItems):
+                    updated = self.backfill(model, options)
+                    self.stdout.write(f'{schema}: {updated} {model._meta.verbose_name_plural} updated')
+
+    def backfill(self, model, options):
+        queryset = model.objects.exclude(description__isnull=True).exclude(description='')
+        if options['missing_only']:
+            queryset = queryset.filter(description_text='')
+
+        batch, updated = [], 0
+        for row in queryset.only('id', 'description').order_by('pk').iterator(chunk_size=options['batch_size']):
+            update_description_fields(row, {})
+            batch.append(row)
+            if len(batch) >= options['batch_size']:
+                updated += self.flush(model, batch, options['pause'])
+                batch = []
+        if batch:
+            updated += self.flush(model, batch, options['pause'])
+        return updated
+
+    def flush(self, model, batch, pause):
+        # bulk_update() skips save(), so updated_at and the model signals do not fire
+        model.objects.bulk_update(batch, DERIVED_FIELDS)
+        if pause:
+            time.sleep(pause)
+        return len(batch)
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:51
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('project', '0007_projectslackchannel'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='projectactivitylog',
+            index=models.Index(fields=['-created_at', '-id'], name='activity_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:53
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('project', '0008_projectactivitylog_created_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='project',
+            index=models.Index(fields=['status', '-id'], name='project_status_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='projectactivitylog',
+            index=models.Index(fields=['project', '-created_at'], name='activity_project_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='projectmembers',
+            index=models.Index(fields=['user', 'project'], name='projectmember_user_project_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:54
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Stored generated column (rewrites the table once), then a concurrent index build
+    atomic = False
+
+    dependencies = [
+        ('project', '0009_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='priority_rank',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(priority='high', then=models.Value(3)), models.When(priority='medium', then=models.Value(2)), models.When(priority='low', then=models.Value(1)), default=models.Value(0)), output_field=models.PositiveSmallIntegerField()),
+        ),
+        AddIndexConcurrently(
+            model_name='project',
+            index=models.Index(fields=['priority_rank', 'id'], name='project_priority_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+from utils.description import DERIVED_FIELDS, update_description_fields
+
+
+def backfill_description_text(apps, schema_editor):
+    # Rows saved before the columns existed; search_vector is generated from description_text
+    Project = apps.get_model('project', 'Project')
+    queryset = Project.objects.exclude(description__isnull=True).exclude(description='').filter(description_text='')
+    batch = []
+    for row in queryset.only('id', 'description').order_by('pk').iterator(chunk_size=2000):
+        update_description_fields(row, {})
+        batch.append(row)
+        if len(batch) >= 2000:
+            Project.objects.bulk_update(batch, DERIVED_FIELDS)
+            batch = []
+    if batch:
+        Project.objects.bulk_update(batch, DERIVED_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    # Batches of the backfill commit on their own
+    atomic = False
+
+    dependencies = [
+        ('project', '0012_description_text_html'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_description_text, migrations.RunPython.noop),
+    ]
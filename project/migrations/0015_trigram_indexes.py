@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:01
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('project', '0014_search_vector'),
+    ]
+
+    operations = [
+        # No-op when the public schema migrations already installed it
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='project_name_trgm_idx'),
+        ),
+    ]
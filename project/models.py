@@ -1,4 +1,12 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Case, Value, When
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Upper
+
+from utils.description import update_description_fields
+from utils.full_text_search import SEARCH_CONFIG
 
 # Create your models here.
 # create project model with project name, priority with (high medium and low), status with (active, on hold, completed), due date and description created at and updated at as well 
@@ -18,17 +26,56 @@ class Project(models.Model):
 
     name = models.CharField(max_length=555)
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default='low')
+    # 1 = low .. 3 = high, so priority sorts by rank; see MappedOrderingFilter
+    priority_rank = models.GeneratedField(
+        expression=Case(
+            When(priority='high', then=Value(3)),
+            When(priority='medium', then=Value(2)),
+            When(priority='low', then=Value(1)),
+            default=Value(0),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active')
     due_date = models.DateField(null=True, blank=True)
     description = models.TextField(null=True, blank=True)
+    # Derived from `description` on save, see utils.description
+    description_html = models.TextField(blank=True, default='')
+    description_text = models.TextField(blank=True, default='')
+    # Plain-text start of `description`, served by list endpoints instead of the HTML
+    description_excerpt = models.CharField(max_length=255, blank=True, default='')
     meeting_link = models.URLField(null=True, blank=True)
+    # Full-text search document, maintained by Postgres; see utils.full_text_search
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('description_text', weight='B', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        update_description_fields(self, kwargs)
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # ongoing projects / status filters, newest first
+            models.Index(fields=['status', '-id'], name='project_status_id_idx'),
+            # ?ordering=priority / -priority
+            models.Index(fields=['priority_rank', 'id'], name='project_priority_rank_idx'),
+            GinIndex(fields=['search_vector'], name='project_search_vector_gin'),
+            # Typeahead prefix and fuzzy matching, see utils.typeahead
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='project_name_trgm_idx'),
+        ]
         
 
 
@@ -44,15 +91,41 @@ class ProjectMembers(models.Model):
 
     class Meta:
         unique_together = ('project', 'user')
+        indexes = [
+            # "projects of user" lookups; unique_together covers (project, user)
+            models.Index(fields=['user', 'project'], name='projectmember_user_project_idx'),
+        ]
 
 class ProjectActivityLog(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
     activity = models.JSONField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Commit message (A) and branch / repository (B) of GitHub push events
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector(
+                KeyTextTransform('message', KeyTransform('head_commit', 'activity')),
+                weight='A', config=SEARCH_CONFIG,
+            )
+            + SearchVector(KeyTextTransform('branch', 'activity'), weight='B', config=SEARCH_CONFIG)
+            + SearchVector(KeyTextTransform('repository', 'activity'), weight='B', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     def __str__(self):
         return f"{self.activity} - {self.project.name}"
 
+    class Meta:
+        indexes = [
+            # keyset (cursor) pagination of the activity feed, see CustomPaginator
+            models.Index(fields=['-created_at', '-id'], name='activity_created_id_idx'),
+            # activity feed of a project
+            models.Index(fields=['project', '-created_at'], name='activity_project_created_idx'),
+            GinIndex(fields=['search_vector'], name='activity_search_vector_gin'),
+        ]
+
 
 class ProjectSlackChannel(models.Model):
     """
@@ -1,5 +1,5 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from customer.models import ActiveClient, UserClientRole
+from customer.access import resolve_role
 
 
 class ProjectAccessPermission(BasePermission):
@@ -21,16 +21,7 @@ class ProjectAccessPermission(BasePermission):
         if not user or user.is_anonymous:
             return False
 
-        active = ActiveClient.objects.select_related("client").filter(user=user).first()
-        if not active:
-            return False
-
-        role = (
-            UserClientRole.objects.filter(user=user, client=active.client)
-            .values_list("role", flat=True)
-            .first()
-        )
-        return bool(role)
+        return bool(resolve_role(request))
 
     def has_object_permission(self, request, view, obj):
         """
@@ -41,23 +32,18 @@ class ProjectAccessPermission(BasePermission):
         if not user or user.is_anonymous:
             return False
 
-        active = ActiveClient.objects.select_related("client").filter(user=user).first()
-        if not active:
-            return False
-
-        role = (
-            UserClientRole.objects.filter(user=user, client=active.client)
-            .values_list("role", flat=True)
-            .first()
-        )
+        role = resolve_role(request)
         if not role:
             return False
 
         if role == "owner":
             return True
 
-        # Must be assigned to access at all for member/viewer
-        is_assigned = obj.projectmembers_set.filter(user=user).exists()
+        # Must be assigned to access at all for member/viewer.
+        # ProjectViewSet annotates `is_member`; only query when it is missing.
+        is_assigned = getattr(obj, "is_member", None)
+        if is_assigned is None:
+            is_assigned = obj.projectmembers_set.filter(user=user).exists()
 
         # Read-only methods
         if request.method in SAFE_METHODS:
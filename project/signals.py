@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from project.models import Project, ProjectMembers
+from utils.queryset_cache import invalidate_table
+
+
+@receiver([post_save, post_delete], sender=ProjectMembers)
+def project_members_changed(sender, instance, **kwargs):
+    invalidate_table(ProjectMembers)
+
+
+@receiver([post_save, post_delete], sender=Project)
+def project_changed(sender, instance, **kwargs):
+    invalidate_table(Project)
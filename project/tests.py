@@ -1,3 +1,516 @@
-from django.test import TestCase
+import base64
+import json
+import os
+from datetime import date
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django_tenants.test.cases import TenantTestCase
+from django_tenants.test.client import TenantClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from customer.access import (
+    CLIENT_ROLE_TOPIC, bump_membership_version, load_client_role, membership_version_cache, role_cache,
+)
+from customer.models import ActiveClient, UserClientRole
+from pms import invalidation
+from pms.jwt_auth import add_client_claims, user_cache
+from utils.custom_paginator import CountStrategyPaginator
+from project.models import Project, ProjectActivityLog, ProjectMembers
+from user.models import UserProfile
+from utils.queryset_cache import get_cache
+
+ROLE_TABLES = ('customer_activeclient', 'customer_userclientrole')
+
+
+class PmsTenantTestCase(TenantTestCase):
+    """
+    Tenant test case with the required Client fields filled in and a helper
+    for authenticating the test client through the access token cookie.
+    """
+
+    @classmethod
+    def setup_tenant(cls, tenant):
+        tenant.name = 'Test Client'
+        tenant.paid_until = date(2099, 1, 1)
+        tenant.on_trial = False
+
+    def setUp(self):
+        super().setUp()
+        role_cache.clear()
+        membership_version_cache.clear()
+        get_cache().clear()
+        self.client = TenantClient(self.tenant)
+
+    def create_user(self, username, role):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='secret')
+        ActiveClient.objects.create(user=user, client=self.tenant)
+        UserClientRole.objects.create(user=user, client=self.tenant, role=role)
+        return user
+
+    def login(self, user):
+        access = add_client_claims(RefreshToken.for_user(user).access_token, load_client_role(user.pk))
+        self.client.cookies['access_token'] = str(access)
+
+
+def count_role_lookups(queries):
+    return sum(
+        1 for query in queries
+        if any(table in query['sql'] for table in ROLE_TABLES)
+    )
+
+
+class ClientRoleResolverQueryCountTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.login(self.member)
+
+    def test_detail_get_resolves_role_once(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/projects/{self.project.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count_role_lookups(ctx.captured_queries), 1)
+
+    def test_detail_get_reuses_cached_role_across_requests(self):
+        self.client.get(f'/api/v1/projects/{self.project.pk}/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/projects/{self.project.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count_role_lookups(ctx.captured_queries), 0)
+
+    def test_role_change_invalidates_cache(self):
+        self.client.get(f'/api/v1/projects/{self.project.pk}/')
+
+        UserClientRole.objects.filter(user=self.member).delete()
+
+        response = self.client.get(f'/api/v1/projects/{self.project.pk}/')
+        self.assertEqual(response.status_code, 403)
+
+
+# exists() fallbacks of ProjectAccessPermission / WorkItemAccessPermission;
+# the annotated EXISTS subqueries are part of the main fetch instead
+MEMBERSHIP_CHECKS = (
+    'SELECT 1 AS "a" FROM "project_projectmembers"',
+    'SELECT 1 AS "a" FROM "auth_user" INNER JOIN "work_items_workitems_assigned_to"',
+)
+
+
+def count_membership_checks(queries):
+    return sum(1 for query in queries if query['sql'].startswith(MEMBERSHIP_CHECKS))
+
+
+class ProjectPermissionQueryCountTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.login(self.member)
+
+    def assert_no_membership_checks(self, method, expected_status, **kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(f'/api/v1/projects/{self.project.pk}/', **kwargs)
+
+        self.assertEqual(response.status_code, expected_status)
+        self.assertEqual(count_membership_checks(ctx.captured_queries), 0)
+
+    def test_retrieve(self):
+        self.assert_no_membership_checks('get', 200)
+
+    def test_partial_update(self):
+        self.assert_no_membership_checks(
+            'patch', 200, data=json.dumps({'name': 'Apollo 11'}), content_type='application/json',
+        )
+
+    def test_destroy(self):
+        self.assert_no_membership_checks('delete', 204)
+
+
+@override_settings(JWT_CLIENT_CLAIMS=True)
+class ClientClaimsTokenTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.login(self.member)
+
+    def test_claims_authorize_without_role_lookup(self):
+        self.client.get(f'/api/v1/projects/{self.project.pk}/')  # warm the membership version
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/projects/{self.project.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count_role_lookups(ctx.captured_queries), 0)
+
+    def test_revoked_role_makes_token_stale(self):
+        client_role = UserClientRole.objects.get(user=self.member)
+        client_role.role = 'viewer'
+        client_role.save()
+
+        response = self.client.get(f'/api/v1/projects/{self.project.pk}/')
+        self.assertEqual(response.status_code, 401)
+
+    def test_saving_stale_active_client_never_rolls_version_back(self):
+        active = ActiveClient.objects.get(user=self.member)
+        issued = active.membership_version
+        bump_membership_version(self.member.pk)
+
+        # e.g. an admin form loaded before the bump
+        active.save()
+
+        active.refresh_from_db()
+        self.assertEqual(active.membership_version, issued + 2)
+
+
+def count_user_lookups(queries):
+    # CookieJWTAuthentication.get_user(), not the user joins of the payload
+    return sum(1 for query in queries if 'FROM "auth_user" WHERE "auth_user"."id" =' in query['sql'])
+
+
+@override_settings(JWT_USER_CACHE_ENABLED=True)
+class JwtUserCacheTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        user_cache.clear()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.login(self.member)
+
+    def get_project(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/projects/{self.project.pk}/')
+        self.assertEqual(response.status_code, 200)
+        return count_user_lookups(ctx.captured_queries)
+
+    def test_repeated_request_skips_user_lookup(self):
+        self.assertEqual(self.get_project(), 1)
+        self.assertEqual(self.get_project(), 0)
+
+    def test_user_save_evicts_cached_user(self):
+        self.get_project()
+
+        self.member.first_name = 'Ada'
+        self.member.save()
+
+        self.assertEqual(len(user_cache), 0)
+        self.assertEqual(self.get_project(), 1)
+
+    def test_profile_save_evicts_cached_user(self):
+        self.get_project()
+
+        UserProfile.objects.create(user=self.member)
+
+        self.assertEqual(len(user_cache), 0)
+        self.assertEqual(self.get_project(), 1)
+
+
+class LeanMiddlewareRouteTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.login(self.member)
+
+    def test_api_routes_skip_browser_layers(self):
+        response = self.client.get('/api/v1/projects/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Frame-Options', response.headers)
+        self.assertNotIn('sessionid', response.cookies)
+
+    def test_admin_keeps_full_stack(self):
+        response = self.client.get('/admin/login/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Frame-Options'], 'DENY')
+        self.assertIn('csrftoken', response.cookies)
+
+
+class ProjectListCacheTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.login(self.member)
+
+    def test_repeated_list_is_served_from_cache(self):
+        self.client.get('/api/v1/projects/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/projects/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total_items'], 1)
+        self.assertFalse([q for q in ctx.captured_queries if 'project_project' in q['sql']])
+
+    def test_membership_change_invalidates_list(self):
+        self.client.get('/api/v1/projects/')
+
+        other = Project.objects.create(name='Gemini')
+        ProjectMembers.objects.create(project=other, user=self.member, role='viewer')
+
+        response = self.client.get('/api/v1/projects/')
+        self.assertEqual(response.json()['total_items'], 2)
+
+
+@override_settings(QUERYSET_CACHE_ENABLED=False)
+class FragmentCacheTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.owner, role='member')
+        self.login(self.owner)
+
+    def test_unchanged_rows_are_not_reserialized(self):
+        self.client.get('/api/v1/projects/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/projects/')
+
+        self.assertEqual(response.json()['results'][0]['team_members'][0]['user']['username'], 'owner')
+        self.assertFalse([q for q in ctx.captured_queries if 'project_projectmembers' in q['sql']])
+
+    def test_row_and_related_changes_refresh_fragments(self):
+        self.client.get('/api/v1/projects/')
+
+        self.project.name = 'Apollo 11'
+        self.project.save()
+        self.owner.first_name = 'Neil'
+        self.owner.save()
+
+        project = self.client.get('/api/v1/projects/').json()['results'][0]
+        self.assertEqual(project['name'], 'Apollo 11')
+        self.assertEqual(project['team_members'][0]['user']['first_name'], 'Neil')
+
+    def test_sparse_fields_skip_team_members(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/projects/', {'fields': 'id,name'})
+
+        self.assertEqual(response.json()['results'], [{'id': self.project.pk, 'name': 'Apollo'}])
+        self.assertFalse([q for q in ctx.captured_queries if 'project_projectmembers' in q['sql']])
+
+
+class ConditionalGetTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.login(self.member)
+
+    def test_matching_etag_returns_304(self):
+        etag = self.client.get('/api/v1/projects/')['ETag']
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/projects/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        # Validated from table versions alone
+        self.assertFalse([q for q in ctx.captured_queries if 'project_project' in q['sql']])
+
+    def test_changes_and_scope_change_the_etag(self):
+        etag = self.client.get('/api/v1/projects/')['ETag']
+
+        self.project.name = 'Apollo 11'
+        self.project.save()
+        response = self.client.get('/api/v1/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        self.member.first_name = 'Neil'
+        self.member.save()
+        self.assertEqual(self.client.get('/api/v1/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        etag = self.client.get('/api/v1/projects/')['ETag']
+        Project.objects.create(name='Gemini').delete()
+        self.assertEqual(self.client.get('/api/v1/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        self.login(self.create_user('owner', 'owner'))
+        self.assertNotEqual(self.client.get('/api/v1/projects/')['ETag'], etag)
+
+    def test_detail_etag(self):
+        url = f'/api/v1/projects/{self.project.pk}/'
+        etag = self.client.get(url)['ETag']
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class CursorPaginationTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        self.project = Project.objects.create(name='Apollo')
+        self.logs = [
+            ProjectActivityLog.objects.create(project=self.project, activity={'n': n})
+            for n in range(5)
+        ]
+        self.login(self.owner)
+
+    def test_cursor_pages_walk_every_row_once(self):
+        url = '/api/v1/project-activity-logs/?pagination=cursor&page_size=2'
+        seen = []
+        while url:
+            body = self.client.get(url).json()
+            self.assertNotIn('total_items', body)
+            seen += [row['id'] for row in body['results']]
+            url = body['next']
+
+        self.assertEqual(seen, [log.pk for log in reversed(self.logs)])
+
+    def test_previous_link_returns_to_first_page(self):
+        first = self.client.get('/api/v1/project-activity-logs/?pagination=cursor&page_size=2').json()
+        second = self.client.get(first['next']).json()
+        back = self.client.get(second['previous']).json()
+
+        self.assertIsNone(first['previous'])
+        self.assertEqual(back['results'], first['results'])
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get('/api/v1/project-activity-logs/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_with_wrong_typed_values_is_404(self):
+        for position in (['yesterday', 1], ['2030-01-01T00:00:00+00:00', 'one'], [{}, []]):
+            payload = json.dumps({'p': position, 'r': 0}).encode()
+            cursor = base64.urlsafe_b64encode(payload).decode()
+            response = self.client.get(f'/api/v1/project-activity-logs/?cursor={cursor}')
+            self.assertEqual(response.status_code, 404, position)
+
+
+class CountStrategyTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        project = Project.objects.create(name='Apollo')
+        for n in range(7):
+            ProjectActivityLog.objects.create(project=project, activity={'n': n})
+        self.queryset = ProjectActivityLog.objects.order_by('-id')
+
+    def test_capped_count_is_flagged_approximate(self):
+        paginator = CountStrategyPaginator(self.queryset, 2, count_strategy='capped', count_cap=3)
+
+        self.assertEqual(paginator.count, 3)
+        self.assertTrue(paginator.count_is_approximate)
+
+        # Pages past the cap are still reachable
+        page = paginator.page(3)
+        self.assertEqual(len(page.object_list), 2)
+        self.assertTrue(page.has_next())
+        self.assertFalse(paginator.page(4).has_next())
+
+    def test_capped_count_below_cap_is_exact(self):
+        paginator = CountStrategyPaginator(self.queryset, 2, count_strategy='capped', count_cap=100)
+
+        self.assertEqual(paginator.count, 7)
+        self.assertFalse(paginator.count_is_approximate)
+
+    def test_estimate_below_threshold_falls_back_to_exact(self):
+        paginator = CountStrategyPaginator(
+            self.queryset.filter(activity__n__gte=0), 2,
+            count_strategy='estimated', estimate_threshold=10 ** 9,
+        )
+
+        self.assertEqual(paginator.count, 7)
+        self.assertFalse(paginator.count_is_approximate)
+
+
+class TypeaheadTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        for name in ('Apollo', 'Mars Apollonia', 'Gemini'):
+            project = Project.objects.create(name=name)
+            ProjectMembers.objects.create(project=project, user=self.member, role='member')
+        Project.objects.create(name='Apollo Hidden')
+        self.login(self.member)
+
+    def test_prefix_matches_rank_first_and_scope_applies(self):
+        response = self.client.get('/api/v1/typeahead/', {'q': 'apol', 'types': 'project'})
+
+        names = [project['name'] for project in response.json()['project']]
+        self.assertEqual(names[0], 'Apollo')
+        self.assertIn('Mars Apollonia', names)
+        self.assertNotIn('Apollo Hidden', names)
+
+    def test_fuzzy_match_tolerates_typos(self):
+        response = self.client.get('/api/v1/typeahead/', {'q': 'gemni', 'types': 'project'})
+
+        self.assertEqual([project['name'] for project in response.json()['project']], ['Gemini'])
+
+    def test_users_are_limited_to_the_active_client(self):
+        User.objects.create_user(username='memberless', email='memberless@example.com')
+
+        response = self.client.get('/api/v1/typeahead/', {'q': 'mem', 'types': 'user'})
+
+        self.assertEqual([user['username'] for user in response.json()['user']], ['member'])
+
+
+class InvalidationBusTests(SimpleTestCase):
+
+    def setUp(self):
+        role_cache.clear()
+
+    def notify(self, key, pid):
+        invalidation.handle_notification(json.dumps(
+            {'topic': CLIENT_ROLE_TOPIC, 'schema': 'public', 'key': key, 'pid': pid}
+        ))
+
+    def test_remote_notification_evicts_key(self):
+        role_cache.set(1, 'cached')
+        role_cache.set(2, 'cached')
+
+        self.notify(1, pid=os.getpid() + 1)
+
+        self.assertIsNone(role_cache.get(1))
+        self.assertEqual(role_cache.get(2), 'cached')
+
+    def test_own_notification_is_ignored(self):
+        role_cache.set(1, 'cached')
+
+        self.notify(1, pid=os.getpid())
+
+        self.assertEqual(role_cache.get(1), 'cached')
+
+    def test_flush_all_clears_registered_caches(self):
+        role_cache.set(1, 'cached')
+
+        invalidation.flush_all()
+
+        self.assertEqual(len(role_cache), 0)
+
+
+class InvalidationOnCommitTests(PmsTenantTestCase):
+
+    def test_publish_evicts_again_on_commit(self):
+        role_cache.set(1, 'cached')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidation.publish(CLIENT_ROLE_TOPIC, 1)
+            self.assertIsNone(role_cache.get(1))
+            # A request re-caching the not yet committed state
+            role_cache.set(1, 'stale')
+
+        self.assertIsNone(role_cache.get(1))
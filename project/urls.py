@@ -3,6 +3,8 @@ from project.adapters.viewset.project_activity_viewset import ProjectActivityLog
 from project.adapters.viewset.project_slack_channel_viewset import ProjectSlackChannelViewSet
 from rest_framework.routers import DefaultRouter
 from project.adapters.viewset.proejct_viewset import ProjectViewSet, OngoingProjectViewSet
+from project.adapters.viewset.search_viewset import SearchView
+from project.adapters.viewset.typeahead_viewset import TypeaheadView
 
 
 router = DefaultRouter()
@@ -13,4 +15,6 @@ router.register(r'project-slack-channels', ProjectSlackChannelViewSet, basename=
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('search/', SearchView.as_view(), name='search'),
+    path('typeahead/', TypeaheadView.as_view(), name='typeahead'),
 ]
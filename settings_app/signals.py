@@ -0,0 +1,13 @@
+from django.db import connection
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from pms import invalidation
+from settings_app.models import SlackToken
+from utils.slack_notification import SLACK_TOKEN_TOPIC
+
+
+@receiver([post_save, post_delete], sender=SlackToken)
+def slack_token_changed(sender, instance, **kwargs):
+    # Cached per tenant, so the schema is the key
+    invalidation.publish(SLACK_TOKEN_TOPIC, connection.schema_name)
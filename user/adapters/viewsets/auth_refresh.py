@@ -4,6 +4,9 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from customer.access import load_client_role
+from pms.jwt_auth import add_client_claims, client_claims_enabled
 
 COOKIE_DOMAIN = ".pms.hunchhadigital.com.np"
 
@@ -17,7 +20,11 @@ class CookieTokenRefreshView(APIView):
 
         try:
             refresh = RefreshToken(refresh_cookie)
-            new_access = str(refresh.access_token)
+            access = refresh.access_token
+            if client_claims_enabled():
+                # Re-resolve claims so a refresh picks up role / active client changes
+                add_client_claims(access, load_client_role(refresh[api_settings.USER_ID_CLAIM]))
+            new_access = str(access)
 
             res = Response({"detail": "Token refreshed"}, status=status.HTTP_200_OK)
             res.set_cookie(
@@ -1,4 +1,6 @@
-from django.contrib.auth import authenticate
+import logging
+
+from django.db.models import BooleanField, ExpressionWrapper, OuterRef, Q, Subquery
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from ..serializers.user_serializers import UserSerializer, LoginSerializer
@@ -9,9 +11,53 @@ from rest_framework.decorators import action
 from rest_framework_simplejwt.tokens import RefreshToken
 from drf_spectacular.utils import extend_schema
 from django.contrib.auth.models import User
-from customer.models import ActiveClient, Client, Domain, UserClientRole
-from ...models import UserProfile
-from pms.jwt_auth import CookieJWTAuthentication
+from customer.models import ActiveClient, Domain, UserClientRole
+from customer.access import ClientRole, resolve_client_role
+from pms.jwt_auth import CookieJWTAuthentication, add_client_claims
+
+logger = logging.getLogger(__name__)
+
+
+def get_login_user(email):
+    """
+    Load the user for `email` (case-insensitive, backed by the UPPER(email)
+    index) together with everything the login response needs, in one query:
+
+    - `profile` via select_related
+    - `active_client_id`, `membership_version`, `client_name`, `schema_name`
+    - `domain` / `domain_is_primary` of the client's primary (or first) domain
+    - `user_role`, the user's role in the active client
+
+    An exact email match wins. When several accounts match only
+    case-insensitively it is unclear which one is meant, and None is returned.
+    """
+    active = ActiveClient.objects.filter(user_id=OuterRef("pk")).order_by("pk")
+    domain = Domain.objects.filter(tenant_id=OuterRef("active_client_id")).order_by("-is_primary", "pk")
+    role = UserClientRole.objects.filter(user_id=OuterRef("pk"), client_id=OuterRef("active_client_id"))
+
+    users = list(
+        User.objects.select_related("profile")
+        .filter(email__iexact=email)
+        .annotate(
+            active_client_id=Subquery(active.values("client_id")[:1]),
+            membership_version=Subquery(active.values("membership_version")[:1]),
+            client_name=Subquery(active.values("client__name")[:1]),
+            schema_name=Subquery(active.values("client__schema_name")[:1]),
+        )
+        .annotate(
+            domain=Subquery(domain.values("domain")[:1]),
+            domain_is_primary=Subquery(domain.values("is_primary")[:1]),
+            user_role=Subquery(role.values("role")[:1]),
+        )
+        .alias(exact_email=ExpressionWrapper(Q(email=email), output_field=BooleanField()))
+        .order_by("-exact_email", "pk")[:2]
+    )
+    if not users:
+        return None
+    if users[0].email == email or len(users) == 1:
+        return users[0]
+    # Ambiguous: the emails differ from the given one and each other only by case
+    return None
 
 
 class AuthViewSet(viewsets.ViewSet):
@@ -20,78 +66,56 @@ class AuthViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=["post"])
     def login_with_email(self, request):
-        print("Login with email called")
         email = request.data.get("email")
         password = request.data.get("password")
 
-        print(f"Login attempt with email: {email}")
-        print(f"Password provided: {'*' * len(password) if password else 'None'}")
-
         if not email or not password:
             return Response(
                 {"error": "Email and password are required"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Find user by email
-        find_user = User.objects.filter(email=email).first()
-        if not find_user:
+        # User, active client, primary domain, role and profile in one round trip
+        user = get_login_user(email)
+        if not user:
+            # Run the password hasher anyway so response timing does not reveal
+            # whether the email exists (same as ModelBackend.authenticate)
+            User().set_password(password)
             return Response(
                 {"error": "Invalid email or password"},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        # Authenticate user
-        user = authenticate(request, username=find_user.username, password=password)
-        print(f"User authenticated: {user}")
-        if not user:
+        if not user.check_password(password) or not user.is_active:
+            logger.info("Failed email login for user %s", user.pk)
             return Response(
                 {"error": "Invalid email or password"},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        try:
-            # Get user's active client
-            active_client_entry = ActiveClient.objects.filter(user=user).first()
-            if not active_client_entry:
-                return Response(
-                    {"error": "No active client found for this user"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-            client = Client.objects.filter(id=active_client_entry.client.id).first()
-            if not client:
-                return Response(
-                    {"error": "Client not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-            # Get the primary domain (or first domain)
-            domain = Domain.objects.filter(tenant=client).first()
-            if not domain:
-                return Response(
-                    {"error": "Domain for client not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-            # Get the user's role for this client
-            user_role_entry = UserClientRole.objects.filter(user=user, client=client).first()
-            user_role = user_role_entry.role if user_role_entry else None
+        if not user.active_client_id:
+            return Response(
+                {"error": "No active client found for this user"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-        except Exception as e:
-            print(f"Error fetching client/domain/role: {e}")
+        if not user.domain:
             return Response(
-                {"error": "Client for this user could not be found"},
+                {"error": "Domain for client not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         # Generate JWT tokens
         refresh = RefreshToken.for_user(user)
-        access_token = str(refresh.access_token)
+        access = add_client_claims(
+            refresh.access_token,
+            ClientRole(user.active_client_id, user.schema_name, user.user_role, user.membership_version),
+        )
+        access_token = str(access)
         refresh_token = str(refresh)
 
-        # Include user profile if exists
-        profile = UserProfile.objects.filter(user=user).first()
+        # Include user profile if exists (select_related, no extra query)
+        profile = getattr(user, "profile", None)
 
         # Prepare response data (NO TOKENS IN BODY - they'll be in cookies)
         response_data = {
@@ -105,14 +129,14 @@ class AuthViewSet(viewsets.ViewSet):
                 "profile_picture": profile.profile_picture.url if profile and profile.profile_picture else None,
             } if profile else None,
             "client": {
-                "name": client.name,
-                "schema_name": client.schema_name,
+                "name": user.client_name,
+                "schema_name": user.schema_name,
             },
             "domains": {
-                "domain": domain.domain,
-                "is_primary": domain.is_primary,
+                "domain": user.domain,
+                "is_primary": user.domain_is_primary,
             },
-            "user_role": user_role,
+            "user_role": user.user_role,
             # NOTE: Tokens are NOT returned in response body
             # They are set as HttpOnly cookies by the response object below
         }
@@ -255,14 +279,14 @@ class ClientViewSet(viewsets.ModelViewSet):
         
         # Get user's active client and associated users
         try:
-            user_active_client = ActiveClient.objects.filter(user=user).first()
-            if not user_active_client:
+            client_role = resolve_client_role(request)
+            if not client_role:
                 return Response(
                     {"error": "No active client found for this user"},
                     status=status.HTTP_404_NOT_FOUND
                 )
             users_in_this_client = UserClientRole.objects.filter(
-                client=user_active_client.client
+                client_id=client_role.client_id
             ).select_related('user').select_related('user__profile')
             client_users = [user_role.user for user_role in users_in_this_client]
             serializer = UserSerializer(client_users, many=True, context={'request': request})
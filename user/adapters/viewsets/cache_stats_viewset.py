@@ -0,0 +1,20 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from pms.jwt_auth import CookieJWTAuthentication
+from utils import queryset_cache
+from utils.ttl_cache import all_stats
+
+
+class CacheStatsView(APIView):
+    """
+    Hit/miss/eviction stats of the in-process caches of the worker serving
+    the request, used to size JWT_USER_CACHE_* and CLIENT_ROLE_CACHE_*,
+    plus per-view hit ratios of the list result cache (utils.queryset_cache).
+    """
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({"caches": all_stats(), "list_caches": queryset_cache.stats()})
@@ -0,0 +1,128 @@
+import logging
+import time
+
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+logger = logging.getLogger(__name__)
+
+# (table, column, index name) the expiry scans rely on. Django indexes
+# django_session.expire_date, simplejwt leaves outstanding_token.expires_at unindexed.
+REQUIRED_INDEXES = [
+    ('token_blacklist_outstandingtoken', 'expires_at', 'token_blacklist_outstandingtoken_expires_at_idx'),
+    ('django_session', 'expire_date', 'django_session_expire_date_prune_idx'),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired JWT outstanding/blacklisted tokens and expired sessions from the "
+        "public schema in small batches, so no statement holds long locks. "
+        "Use --loop-interval to keep running as a periodic job."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows deleted per statement')
+        parser.add_argument('--pause', type=float, default=0.05, help='Seconds to sleep between batches')
+        parser.add_argument(
+            '--loop-interval', type=int, default=0,
+            help='Run forever, pruning every N seconds (0 = run once and exit)',
+        )
+        parser.add_argument('--skip-index-check', action='store_true', help='Do not create missing indexes')
+
+    def handle(self, *args, **options):
+        connection.set_schema_to_public()
+
+        if not options['skip_index_check']:
+            self.ensure_indexes()
+
+        while True:
+            # long-running loop: drop connections that went stale between runs
+            close_old_connections()
+            try:
+                self.prune(options['batch_size'], options['pause'])
+            except Exception:
+                if not options['loop_interval']:
+                    raise
+                logger.exception("Pruning auth tables failed, retrying next interval")
+
+            if not options['loop_interval']:
+                break
+            time.sleep(options['loop_interval'])
+
+    def ensure_indexes(self):
+        """
+        Create (concurrently) any index whose leading column is not indexed yet.
+        """
+        with connection.cursor() as cursor:
+            for table, column, name in REQUIRED_INDEXES:
+                cursor.execute(
+                    "SELECT 1 FROM pg_index i "
+                    "JOIN pg_class t ON t.oid = i.indrelid "
+                    "JOIN pg_namespace n ON n.oid = t.relnamespace "
+                    "JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = i.indkey[0] "
+                    "WHERE n.nspname = 'public' AND t.relname = %s AND a.attname = %s",
+                    [table, column],
+                )
+                if cursor.fetchone():
+                    continue
+
+                self.stdout.write(f'Creating index {name} on {table} ({column})')
+                # CONCURRENTLY must run outside a transaction; management commands run in autocommit
+                cursor.execute(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})'
+                )
+
+    def prune(self, batch_size, pause):
+        now = timezone.now()
+
+        # Deleting an OutstandingToken cascades to its BlacklistedToken
+        tokens_removed = self.delete_in_batches(
+            OutstandingToken.objects.filter(expires_at__lte=now), batch_size, pause
+        )
+        sessions_removed = self.delete_in_batches(
+            Session.objects.filter(expire_date__lt=now), batch_size, pause
+        )
+
+        self.stdout.write(
+            f'{now:%Y-%m-%d %H:%M:%S} removed {tokens_removed} expired tokens, '
+            f'{sessions_removed} expired sessions'
+        )
+        for model in (OutstandingToken, BlacklistedToken, Session):
+            rows, size = self.table_stats(model._meta.db_table)
+            self.stdout.write(f'  {model._meta.db_table:<36} ~{rows} rows, {size}')
+
+    @staticmethod
+    def delete_in_batches(queryset, batch_size, pause):
+        """
+        Delete the matching rows `batch_size` at a time, each batch in its own
+        short statement, and return the number of rows removed from queryset.model.
+        """
+        model = queryset.model
+        removed = 0
+        while True:
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return removed
+
+            _, per_model = model.objects.filter(pk__in=ids).delete()
+            removed += per_model.get(model._meta.label, 0)
+
+            if len(ids) < batch_size:
+                return removed
+            time.sleep(pause)
+
+    @staticmethod
+    def table_stats(table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.reltuples::bigint, pg_size_pretty(pg_total_relation_size(c.oid)) "
+                "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = 'public' AND c.relname = %s",
+                [table],
+            )
+            row = cursor.fetchone()
+        return row if row else (0, 'n/a')
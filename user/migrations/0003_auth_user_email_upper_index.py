@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Expression index matching the SQL Django emits for `email__iexact`
+    (UPPER("auth_user"."email"::text) = UPPER(%s)), used by email login.
+    Built concurrently so it does not block writes to auth_user.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('user', '0002_alter_userprofile_user'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS auth_user_email_upper_idx ON auth_user (UPPER(email::text));',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS auth_user_email_upper_idx;',
+        ),
+    ]
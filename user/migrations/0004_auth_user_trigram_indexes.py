@@ -0,0 +1,31 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TRIGRAM_COLUMNS = ('username', 'email', 'first_name', 'last_name')
+
+
+class Migration(migrations.Migration):
+    """
+    pg_trgm and `UPPER(column) gin_trgm_ops` indexes on the auth_user columns
+    the typeahead endpoint matches (see utils.typeahead). Built concurrently
+    so they do not block writes to auth_user.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('user', '0003_auth_user_email_upper_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ] + [
+        migrations.RunSQL(
+            sql=(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS auth_user_{column}_trgm_idx '
+                f'ON auth_user USING gin (UPPER({column}::text) gin_trgm_ops);'
+            ),
+            reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS auth_user_{column}_trgm_idx;',
+        )
+        for column in TRIGRAM_COLUMNS
+    ]
@@ -0,0 +1,20 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from pms import invalidation
+from pms.jwt_auth import USER_TOPIC
+from user.models import UserProfile
+from utils.queryset_cache import invalidate_table
+
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, instance, **kwargs):
+    invalidation.publish(USER_TOPIC, instance.pk)
+    invalidate_table(User)
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+def user_profile_changed(sender, instance, **kwargs):
+    invalidation.publish(USER_TOPIC, instance.user_id)
+    invalidate_table(UserProfile)
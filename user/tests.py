@@ -1,3 +1,28 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
 
-# Create your tests here.
+from project.tests import PmsTenantTestCase
+from user.adapters.viewsets.auth_viewset import get_login_user
+
+
+class LoginUserLookupTests(PmsTenantTestCase):
+
+    def create_account(self, username, email):
+        return User.objects.create_user(username=username, email=email, password='secret')
+
+    def test_email_is_matched_case_insensitively(self):
+        user = self.create_account('ada', 'Ada@example.com')
+
+        self.assertEqual(get_login_user('ada@EXAMPLE.com').pk, user.pk)
+
+    def test_exact_match_wins_over_case_variants(self):
+        first = self.create_account('ada', 'Ada@example.com')
+        second = self.create_account('ada2', 'ada@example.com')
+
+        self.assertEqual(get_login_user('Ada@example.com').pk, first.pk)
+        self.assertEqual(get_login_user('ada@example.com').pk, second.pk)
+
+    def test_ambiguous_case_insensitive_match_is_rejected(self):
+        self.create_account('ada', 'Ada@example.com')
+        self.create_account('ada2', 'ada@example.com')
+
+        self.assertIsNone(get_login_user('ADA@example.com'))
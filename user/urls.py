@@ -6,6 +6,7 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView
 )
 from .adapters.viewsets.auth_refresh import CookieTokenRefreshView
+from .adapters.viewsets.cache_stats_viewset import CacheStatsView
 
 
 urlpatterns = [
@@ -34,4 +35,7 @@ urlpatterns = [
 
     # user related to the requested user client
     path('my-client-users/', auth_viewset.ClientViewSet.as_view({'get': 'my_client_users'}), name='my_client_users'),
+
+    # in-process cache stats (staff only)
+    path('cache-stats/', CacheStatsView.as_view(), name='cache_stats'),
 ]
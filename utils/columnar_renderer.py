@@ -0,0 +1,90 @@
+"""
+Columnar JSON for list endpoints (`?format=columnar`).
+
+Rows become one array per field, in field order, and nested users/projects
+are replaced by their id and listed once in a side table under `references`:
+
+    {"total_items": 2, ..., "results": {"id": [7, 8], "assigned_to": [[3], [3, 4]], ...},
+     "references": {"users": {"3": {...}, "4": {...}}}}
+
+Views opt in by adding ColumnarJSONRenderer to `renderer_classes` and
+describing their references:
+
+- `columnar_references`: {"field": "table"} for a nested object (or list of
+  them) with an `id`; {"field.key": "table"} for the object under `key` in
+  each item of a list field (e.g. team_members[].user)
+- `columnar_flat_references`: {"id_field": ("table", {"field": "name"})} to
+  fold flat columns (e.g. project_id / project_name) into a side table
+
+Detail responses and errors are rendered as plain JSON.
+"""
+from collections import defaultdict
+
+from rest_framework.renderers import JSONRenderer
+
+
+def _reference(value, table, references):
+    if value is None:
+        return None
+    references[table].setdefault(str(value['id']), value)
+    return value['id']
+
+
+def _collapse(value, key, table, references):
+    if isinstance(value, list):
+        return [_collapse(item, key, table, references) for item in value]
+    if key:
+        if value is None:
+            return None
+        return {**value, key: _reference(value.get(key), table, references)}
+    return _reference(value, table, references)
+
+
+def to_columnar(rows, references_spec=None, flat_references_spec=None):
+    """
+    (columns, references) for a list of serialized rows.
+    """
+    references = defaultdict(dict)
+    columns = {}
+
+    for row in rows:
+        row = dict(row)
+        for id_field, (table, renames) in (flat_references_spec or {}).items():
+            values = {name: row.pop(field, None) for field, name in renames.items()}
+            if row.get(id_field) is not None:
+                references[table].setdefault(str(row[id_field]), {'id': row[id_field], **values})
+
+        for path, table in (references_spec or {}).items():
+            field, _, key = path.partition('.')
+            if field in row:
+                row[field] = _collapse(row[field], key, table, references)
+
+        for name, value in row.items():
+            columns.setdefault(name, []).append(value)
+
+    return columns, dict(references)
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        response = renderer_context.get('response')
+        if response is not None and response.status_code != 200:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        view = renderer_context.get('view')
+        spec = (
+            getattr(view, 'columnar_references', None),
+            getattr(view, 'columnar_flat_references', None),
+        )
+
+        if isinstance(data, list):
+            columns, references = to_columnar(data, *spec)
+            data = {'results': columns, 'references': references}
+        elif isinstance(data, dict) and isinstance(data.get('results'), list):
+            columns, references = to_columnar(data['results'], *spec)
+            data = {**data, 'results': columns, 'references': references}
+
+        return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,133 @@
+"""
+Conditional GET (ETag / Last-Modified) for polled endpoints.
+
+An ETag is a hash of everything a response depends on, computed without
+serializing anything:
+
+- the view, tenant schema, host and full path (filters, search, ordering, page)
+- the requester's role and user id, since role scoping decides the visible rows
+- the version tokens (utils.queryset_cache) of the tables the payload reads:
+  for lists the queryset's own table and the related ones, so validating a
+  list runs no query; for details the object's `updated_at` stands in for
+  its own table
+- for details, the object's pk and `updated_at`
+
+A matching If-None-Match gets a 304 before serialization. Details also send
+Last-Modified, but If-Modified-Since alone never yields a 304: related-table
+changes do not move `updated_at`.
+
+The version tokens live in the QUERYSET_CACHE_ALIAS cache and expire after
+TABLE_VERSION_TTL seconds, which bounds how long a worker that missed an
+invalidation can answer 304. With a per-process backend (the LocMem default)
+every worker has its own tokens, so an ETag only validates against the worker
+that issued it and other workers answer 200. Point the alias at a shared
+backend (Redis, Memcached) for 304s across workers.
+"""
+import hashlib
+from functools import wraps
+
+from django.db import connection
+from django.utils import timezone
+from django.utils.http import http_date, parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from customer.access import resolve_role
+from utils.queryset_cache import get_table_versions
+
+
+def make_etag(request, name, *parts) -> str:
+    digest = hashlib.sha1(repr([
+        name,
+        connection.schema_name,
+        request.get_host(),
+        request.get_full_path(),
+        resolve_role(request),
+        request.user.pk,
+        *parts,
+    ]).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def not_modified(request, etag) -> bool:
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    # Weak comparison, as for GET in RFC 9110
+    etags = {tag.removeprefix('W/') for tag in parse_etags(header)}
+    return '*' in etags or etag in etags
+
+
+def conditional_response(request, etag, last_modified, respond):
+    """
+    304 when `etag` matches If-None-Match, else `respond()`; validators set on both.
+    """
+    if not_modified(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = respond()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    # Validators differ per user; shared caches must not reuse them
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin answering `list()` and `retrieve()` with ETags and 304s.
+    The queryset model needs an `updated_at` field.
+
+    - `conditional_models`: models whose table versions join the ETag, the
+      queryset model included (defaults to the view's `cache_models`)
+    Place it first, so a 304 also skips CachedListMixin.
+    """
+    conditional_models = None
+
+    def get_conditional_models(self):
+        models = self.conditional_models
+        if models is None:
+            models = getattr(self, 'cache_models', ())
+        return models
+
+    def list(self, request, *args, **kwargs):
+        etag = make_etag(
+            request, type(self).__name__, 'list', *get_table_versions(self.get_conditional_models()),
+        )
+        return conditional_response(
+            request, etag, None, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        # updated_at covers the object's own row; other rows of its table do not matter
+        models = [model for model in self.get_conditional_models() if model is not instance._meta.concrete_model]
+        etag = make_etag(
+            request, type(self).__name__, 'retrieve', instance.pk, instance.updated_at,
+            *get_table_versions(models),
+        )
+        # RetrieveModelMixin.retrieve() without a second get_object()
+        return conditional_response(
+            request, etag, instance.updated_at, lambda: Response(self.get_serializer(instance).data),
+        )
+
+
+def conditional_on_tables(*models):
+    """
+    Decorator for GET handlers of aggregate views (e.g. dashboards) whose
+    response depends only on `models` and today's date.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            etag = make_etag(
+                request, f'{type(self).__name__}.{handler.__name__}', timezone.localdate(),
+                *get_table_versions(models),
+            )
+            return conditional_response(request, etag, None, lambda: handler(self, request, *args, **kwargs))
+        return wrapper
+    return decorator
@@ -1,18 +1,285 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATED = 'estimated'
+COUNT_CAPPED = 'capped'
+
+
+def estimate_count(queryset):
+    """
+    Planner row estimate for `queryset`: pg_class.reltuples for a plain table
+    scan, the top plan node's rows from EXPLAIN otherwise. None if unknown.
+    """
+    queryset = queryset.order_by()
+    query = queryset.query
+    with connections[queryset.db].cursor() as cursor:
+        if not query.where and not query.distinct:
+            # search_path resolves the table inside the current tenant schema
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # -1 (or 0) until the table has been vacuumed/analyzed
+            return int(row[0]) if row and row[0] > 0 else None
+
+        sql, params = query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class ApproximateCountPage(Page):
+    """
+    Page of an approximately counted list: whether there is a next page comes
+    from fetching one extra row, not from the (approximate) page count.
+    """
+    has_more = False
+
+    def has_next(self):
+        return self.has_more
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Django paginator whose `count` follows a count strategy:
+
+    - exact: COUNT(*), as Django does
+    - estimated: the planner estimate when it is at least `estimate_threshold`
+      rows, an exact count below that
+    - capped: COUNT(*) over at most `count_cap` + 1 rows
+    """
+
+    def __init__(self, *args, count_strategy=COUNT_EXACT, estimate_threshold=10000, count_cap=10000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_strategy = count_strategy
+        self.estimate_threshold = estimate_threshold
+        self.count_cap = count_cap
+        self.count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        if self.count_strategy == COUNT_ESTIMATED:
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                self.count_is_approximate = True
+                return estimate
+
+        elif self.count_strategy == COUNT_CAPPED:
+            count = self.object_list.order_by()[:self.count_cap + 1].count()
+            if count > self.count_cap:
+                self.count_is_approximate = True
+                return self.count_cap
+            return count
+
+        return super().count
+
+    def validate_number(self, number):
+        self.count  # noqa: B018 - decides count_is_approximate
+        if not self.count_is_approximate:
+            return super().validate_number(number)
+
+        # Pages past the estimate may exist; an empty page is the real end
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+
+        page = ApproximateCountPage(rows[:self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
 
 class CustomPaginator(PageNumberPagination):
+    """
+    Page number pagination, with an opt-in keyset (cursor) mode.
+
+    The total is counted with the view's `count_strategy` (or the
+    PAGINATION_COUNT_STRATEGY setting): "exact", "estimated" or "capped",
+    see CountStrategyPaginator. Responses flag `count_is_approximate`.
+
+    Views declaring `cursor_ordering` (e.g. ("-id",) or ("-created_at", "-id"),
+    a unique, single-direction ordering backed by an index) can be paged with
+    `?pagination=cursor` or by following a `cursor` link. Keyset pages filter
+    on the last row's ordering values instead of OFFSET and skip COUNT(*), so
+    any page costs the same; `?ordering=` is ignored in that mode.
+    """
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    invalid_cursor_message = 'Invalid cursor'
+
+    use_cursor = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, 'cursor_ordering', None)
+        self.use_cursor = bool(ordering) and (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == 'cursor'
+        )
+        if not self.use_cursor:
+            self.django_paginator_class = partial(
+                CountStrategyPaginator,
+                count_strategy=getattr(view, 'count_strategy', None)
+                or getattr(settings, 'PAGINATION_COUNT_STRATEGY', COUNT_EXACT),
+                estimate_threshold=getattr(settings, 'PAGINATION_COUNT_ESTIMATE_THRESHOLD', 10000),
+                count_cap=getattr(settings, 'PAGINATION_COUNT_CAP', 10000),
+            )
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_cursor(queryset, request, ordering)
 
     def get_paginated_response(self, data):
+        if self.use_cursor:
+            return Response({
+                'page_size': self.page_size_used,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'results': data
+            })
+
         return Response({
             'total_items': self.page.paginator.count,
+            'count_is_approximate': self.page.paginator.count_is_approximate,
             'current_page': self.page.number,
             'total_pages': self.page.paginator.num_pages,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'results': data
         })
+
+    # ----------------------------
+    # Keyset mode
+    # ----------------------------
+
+    def paginate_cursor(self, queryset, request, ordering):
+        self.request = request
+        self.ordering = tuple(ordering)
+        self.fields = [field.lstrip('-') for field in self.ordering]
+        self.page_size_used = self.get_page_size(request)
+
+        position, reverse = self.decode_cursor(request)
+
+        descending = self.ordering[0].startswith('-')
+        if reverse:
+            # Walk backwards: flip the ordering, then flip the page back
+            descending = not descending
+            queryset = queryset.order_by(*(
+                field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering
+            ))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.keyset_filter(position, descending))
+            except (ValueError, TypeError, ValidationError):
+                # Well-formed cursor whose values do not fit the ordering fields
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = list(queryset[:self.page_size_used + 1])
+        has_more = len(rows) > self.page_size_used
+        rows = rows[:self.page_size_used]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.first_position = self.position_of(rows[0]) if rows else None
+        self.last_position = self.position_of(rows[-1]) if rows else None
+        return rows
+
+    def keyset_filter(self, position, descending):
+        """
+        Rows strictly after `position` in (f1, f2, ...) order, expanded to
+        f1 <= x1 AND (f1 < x1 OR (f1 = x1 AND f2 < x2) ...) so the leading
+        range condition can drive an index scan.
+        """
+        lookup = 'lt' if descending else 'gt'
+        expanded = Q()
+        for index, field in enumerate(self.fields):
+            condition = Q(**{f'{field}__{lookup}': position[index]})
+            for previous, value in zip(self.fields[:index], position[:index]):
+                condition &= Q(**{previous: value})
+            expanded |= condition
+        return Q(**{f'{self.fields[0]}__{lookup}e': position[0]}) & expanded
+
+    def position_of(self, row):
+        values = []
+        for field in self.fields:
+            value = row[field] if isinstance(row, dict) else getattr(row, field)
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            values.append(value)
+        return values
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            position, reverse = payload['p'], bool(payload['r'])
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.fields):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.use_cursor:
+            return super().get_previous_link()
+        if not self.has_previous or self.first_position is None:
+            return None
+        return self.encode_cursor(self.first_position, reverse=True)
@@ -0,0 +1,88 @@
+"""
+Helpers deriving stored, cheap-to-serve variants of Summernote HTML descriptions.
+
+Project and WorkItems keep three columns next to `description`, recomputed on save().
+Existing rows are filled by the backfill_description_text migrations, and
+`manage.py backfill_descriptions` recomputes every row after a sanitizer change:
+
+- description_html: bleach-sanitized HTML
+- description_text: plain text of the sanitized HTML (Slack, search)
+- description_excerpt: the first EXCERPT_LENGTH characters of the text (list endpoints)
+"""
+import html
+import re
+
+import bleach
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 200
+
+DERIVED_FIELDS = ('description_html', 'description_text', 'description_excerpt')
+
+# What the Summernote toolbar produces, minus inline styles and scripts
+ALLOWED_TAGS = {
+    'a', 'b', 'blockquote', 'br', 'code', 'div', 'em', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'hr', 'i', 'img', 'li', 'ol', 'p', 'pre', 's', 'span', 'strike', 'strong', 'sub', 'sup',
+    'table', 'tbody', 'td', 'th', 'thead', 'tr', 'u', 'ul',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': ['href', 'title', 'target', 'rel'],
+    'img': ['src', 'alt', 'title', 'width', 'height'],
+    'td': ['colspan', 'rowspan'],
+    'th': ['colspan', 'rowspan'],
+}
+ALLOWED_PROTOCOLS = {'http', 'https', 'mailto'}
+
+# bleach strips disallowed tags but keeps their text; drop these with their content
+_SCRIPT_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# Block-level boundaries that must become word breaks in the plain text
+_BLOCK_TAG_RE = re.compile(
+    r'</?(?:p|div|br|li|ul|ol|h[1-6]|blockquote|pre|table|tr|td|th|hr)\b[^>]*>',
+    re.IGNORECASE,
+)
+
+
+def sanitize_html(value) -> str:
+    if not value:
+        return ''
+    return bleach.clean(
+        _SCRIPT_RE.sub('', str(value)),
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        protocols=ALLOWED_PROTOCOLS,
+        strip=True,
+    )
+
+
+def html_to_text(value) -> str:
+    """
+    Plain text of an HTML fragment, with entities decoded and whitespace collapsed.
+    """
+    if not value:
+        return ''
+    spaced = _BLOCK_TAG_RE.sub(lambda match: f' {match.group(0)} ', str(value))
+    text = bleach.clean(spaced, tags=set(), strip=True)
+    return ' '.join(html.unescape(text).split())
+
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    return Truncator(text).chars(length)
+
+
+def update_description_fields(instance, save_kwargs: dict) -> None:
+    """
+    Recompute the derived description columns of `instance` before save().
+    Extends `update_fields` when it names `description`; a deferred
+    (never loaded) description is left alone.
+    """
+    if 'description' in instance.get_deferred_fields():
+        return
+
+    instance.description_html = sanitize_html(instance.description)
+    instance.description_text = html_to_text(instance.description_html)
+    instance.description_excerpt = make_excerpt(instance.description_text)
+
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None and 'description' in update_fields:
+        save_kwargs['update_fields'] = {*update_fields, *DERIVED_FIELDS}
@@ -0,0 +1,100 @@
+"""
+Per-row cache of serialized list items ("fragments").
+
+A fragment is one row's serialized dict, keyed by:
+
+- the serializer, its (?fields= trimmed) field names and the request host
+  (absolute URLs in the payload)
+- the tenant schema and the version tokens of the related tables the
+  representation embeds (see utils.queryset_cache.get_table_versions), so a
+  member or profile change re-serializes the rows that could show it
+- the row's pk and `updated_at` (auto_now), plus any per-row parts the caller
+  adds for state `updated_at` does not cover (e.g. assignee_ids)
+
+Lists look all fragments of a page up with one get_many() and only serialize
+the misses, so polling clients mostly pay for the query.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.models import prefetch_related_objects
+from rest_framework import serializers
+
+from utils.queryset_cache import get_table_versions
+
+
+def fragment_cache_enabled() -> bool:
+    return getattr(settings, 'FRAGMENT_CACHE_ENABLED', False)
+
+
+def get_fragment_cache():
+    return caches[getattr(settings, 'FRAGMENT_CACHE_ALIAS', 'default')]
+
+
+class FragmentCache:
+    """
+    Fragments of one representation (`name` with `field_names`) embedding
+    `models`, for one request.
+    """
+
+    def __init__(self, name, field_names=(), models=(), request=None):
+        host = request.get_host() if request is not None else ''
+        self.prefix = ':'.join([
+            'frag', name, connection.schema_name, *get_table_versions(models),
+            hashlib.sha1(f'{host}:{",".join(field_names)}'.encode()).hexdigest()[:12],
+        ])
+        self.cache = get_fragment_cache()
+
+    def key(self, pk, updated_at, *parts) -> str:
+        key = f'{self.prefix}:{pk}:{updated_at.isoformat() if updated_at else ""}'
+        if parts:
+            key += ':' + hashlib.sha1(repr(parts).encode()).hexdigest()[:12]
+        return key
+
+    def get_many(self, keys) -> dict:
+        return self.cache.get_many(keys)
+
+    def set_many(self, fragments: dict) -> None:
+        if fragments:
+            self.cache.set_many(fragments, getattr(settings, 'FRAGMENT_CACHE_TTL', 3600))
+
+
+class FragmentCachedListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer serving each item from the fragment cache.
+
+    The child serializer's Meta may declare:
+
+    - `fragment_models`: related models whose tables the representation reads
+    - `fragment_prefetch`: {field name: prefetch_related() lookups}, applied
+      to cache misses only and skipped for fields dropped by ?fields=
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        meta = self.child.Meta
+        prefetch = [
+            lookup
+            for field, lookups in getattr(meta, 'fragment_prefetch', {}).items() if field in self.child.fields
+            for lookup in lookups
+        ]
+
+        if not fragment_cache_enabled():
+            prefetch_related_objects(items, *prefetch)
+            return [self.child.to_representation(item) for item in items]
+
+        fragments = FragmentCache(
+            type(self.child).__name__, list(self.child.fields),
+            getattr(meta, 'fragment_models', ()), self.context.get('request'),
+        )
+        keys = [fragments.key(item.pk, item.updated_at) for item in items]
+        cached = fragments.get_many(keys)
+
+        misses = {key: item for item, key in zip(items, keys) if key not in cached}
+        prefetch_related_objects(list(misses.values()), *prefetch)
+        fresh = {key: self.child.to_representation(item) for key, item in misses.items()}
+        fragments.set_many(fresh)
+
+        return [cached[key] if key in cached else fresh[key] for key in keys]
@@ -0,0 +1,54 @@
+"""
+Postgres full-text search over the generated, GIN-indexed `search_vector`
+columns of Project, WorkItems and ProjectActivityLog.
+
+Queries are built for search-as-you-type: every word of the input must match,
+and the last one matches as a prefix (`ship & relea:*`).
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+from rest_framework.filters import SearchFilter
+
+SEARCH_CONFIG = 'english'
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def build_search_query(text):
+    """
+    SearchQuery for user input, or None when it holds no searchable words.
+    Words are reduced to \\w runs, so no tsquery syntax can be injected.
+    """
+    words = _WORD_RE.findall(text or '')
+    if not words:
+        return None
+    terms = [f"'{word}'" for word in words[:-1]] + [f"'{words[-1]}':*"]
+    return SearchQuery(' & '.join(terms), search_type='raw', config=SEARCH_CONFIG)
+
+
+def rank(query, field='search_vector'):
+    return SearchRank(F(field), query)
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    SearchFilter answering `?search=` from the view's `search_vector_field`
+    (a GIN-indexed tsvector) instead of ILIKE '%term%' over `search_fields`.
+    Views without `search_vector_field` keep the stock behaviour.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        field = getattr(view, 'search_vector_field', None)
+        if not field:
+            return super().filter_queryset(request, queryset, view)
+
+        text = request.query_params.get(self.search_param, '')
+        if not text.strip():
+            return queryset
+
+        query = build_search_query(text)
+        if query is None:
+            return queryset.none()
+        return queryset.filter(**{field: query})
@@ -0,0 +1,78 @@
+from typing import Optional
+
+from rest_framework.exceptions import ValidationError
+
+
+def _query_list(request, param) -> list:
+    values = request.query_params.getlist(param)
+    return [name.strip() for value in values for name in value.split(',') if name.strip()]
+
+
+def requested_includes(request) -> set:
+    """
+    Names passed in `?include=a,b` (or repeated `?include=a&include=b`).
+    """
+    if request is None:
+        return set()
+    return set(_query_list(request, 'include'))
+
+
+def requested_fields(request) -> Optional[set]:
+    """
+    Names passed in `?fields=a,b` (or repeated), None when the parameter is
+    absent or names nothing.
+    """
+    if request is None:
+        return None
+    return set(_query_list(request, 'fields')) or None
+
+
+def field_requested(request, name) -> bool:
+    """
+    Whether the response should carry `name`: every field does unless `?fields=` narrows them.
+    """
+    fields = requested_fields(request)
+    return fields is None or name in fields
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin keeping only the fields named in `?fields=` of the
+    context request; without the parameter every field is kept. Views check
+    field_requested() to skip the joins and prefetches of dropped fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = requested_fields(self.context.get('request'))
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
+
+
+class QueryFieldsMixin:
+    """
+    ViewSet mixin answering unknown names in `?fields=` (checked against the
+    fields of `serializer_class`) or `?include=` (checked against
+    `include_options`) with a 400 instead of silently ignoring them.
+    """
+    include_options = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        unknown = requested_includes(request) - set(self.include_options)
+        if unknown:
+            raise ValidationError({'include': [
+                f'Unknown include: {", ".join(sorted(unknown))}. '
+                f'Available: {", ".join(self.include_options) or "none"}.'
+            ]})
+
+        fields = requested_fields(request)
+        if fields is not None:
+            available = list(self.serializer_class().fields)
+            unknown = fields - set(available)
+            if unknown:
+                raise ValidationError({'fields': [
+                    f'Unknown fields: {", ".join(sorted(unknown))}. Available: {", ".join(available)}.'
+                ]})
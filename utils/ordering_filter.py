@@ -0,0 +1,34 @@
+from rest_framework.filters import OrderingFilter
+
+
+class MappedOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that sorts public ordering names on other columns.
+
+    Views declare `ordering_field_map`, e.g. {"priority": "priority_rank"}, so
+    `?ordering=-priority` sorts by rank (high > medium > low) instead of the
+    alphabetical CharField. When a mapped field is used, the primary key is
+    appended in the same direction as a tiebreaker, matching the (rank, id)
+    indexes and keeping pages stable.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        field_map = getattr(view, 'ordering_field_map', None)
+        if not ordering or not field_map:
+            return ordering
+
+        mapped = []
+        tiebreaker = None
+        for term in ordering:
+            prefix = '-' if term.startswith('-') else ''
+            field = term.lstrip('-')
+            if field in field_map:
+                mapped.append(f'{prefix}{field_map[field]}')
+                tiebreaker = tiebreaker or f'{prefix}pk'
+            else:
+                mapped.append(term)
+
+        if tiebreaker and not any(term.lstrip('-') in ('pk', 'id') for term in mapped):
+            mapped.append(tiebreaker)
+        return mapped
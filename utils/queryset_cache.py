@@ -0,0 +1,163 @@
+"""
+Opt-in, tenant-aware cache of list endpoint results.
+
+Entries live in the QUERYSET_CACHE_ALIAS cache and are keyed by:
+
+- the tenant schema (django_tenants' `connection.schema_name`)
+- a version token per (schema, table) the view reads from
+- the requesting user's scope (role, and user id unless they are an owner)
+- the full request path, so filters, search, ordering and pages are distinct
+
+Saving or deleting a tracked model calls `invalidate_table()`, which drops the
+(schema, table) version token in every worker through the `pms.invalidation`
+bus; entries under the old token are never read again and age out by TTL.
+Tokens themselves expire after TABLE_VERSION_TTL seconds, so a worker that
+missed a notification (listener down or never connected) serves stale lists
+and 304s for at most that long.
+Shared-app tables (auth_user, user_userprofile) are versioned under the public schema.
+"""
+import hashlib
+import threading
+import uuid
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django_tenants.utils import get_public_schema_name
+from rest_framework.response import Response
+
+from customer.access import resolve_role
+from pms import invalidation
+
+TABLE_TOPIC = 'table_version'
+
+_stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+_stats_lock = threading.Lock()
+
+
+def queryset_cache_enabled() -> bool:
+    return getattr(settings, 'QUERYSET_CACHE_ENABLED', False)
+
+
+def table_version_ttl() -> int:
+    return getattr(settings, 'TABLE_VERSION_TTL', 300)
+
+
+def get_cache():
+    return caches[getattr(settings, 'QUERYSET_CACHE_ALIAS', 'default')]
+
+
+def is_shared_model(model) -> bool:
+    app_name = apps.get_app_config(model._meta.app_label).name
+    return app_name in settings.SHARED_APPS and app_name not in settings.TENANT_APPS
+
+
+def table_schema(model) -> str:
+    if is_shared_model(model):
+        return get_public_schema_name()
+    return connection.schema_name
+
+
+def version_key(schema: str, table: str) -> str:
+    return f'tv:{schema}:{table}'
+
+
+def get_table_versions(models) -> list:
+    """
+    Current version token of each model's table, creating missing tokens.
+    """
+    cache = get_cache()
+    keys = [version_key(table_schema(model), model._meta.db_table) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # add() keeps a token another worker set in the meantime
+            cache.add(key, uuid.uuid4().hex[:12], timeout=table_version_ttl())
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _drop_version(schema, table):
+    if schema is None or table is None:
+        # Listener (re)connected and may have missed invalidations
+        get_cache().clear()
+    else:
+        get_cache().delete(version_key(schema, table))
+
+
+invalidation.register(TABLE_TOPIC, _drop_version)
+
+
+def invalidate_table(model) -> None:
+    """
+    Invalidate every cached result that read from `model`'s table, in every worker.
+    Called from post_save/post_delete/m2m_changed receivers of tracked models.
+    """
+    schema = table_schema(model)
+    table = model._meta.db_table
+    # publish() drops the token here again on commit, in case readers in this
+    # process re-cached pre-commit data meanwhile
+    invalidation.publish(TABLE_TOPIC, table, schema=schema)
+
+
+def record(view_name: str, hit: bool) -> None:
+    with _stats_lock:
+        _stats[view_name]['hits' if hit else 'misses'] += 1
+
+
+def stats() -> list:
+    with _stats_lock:
+        return [
+            {
+                'view': view_name,
+                'hits': counters['hits'],
+                'misses': counters['misses'],
+                'hit_ratio': round(counters['hits'] / (counters['hits'] + counters['misses']), 4),
+            }
+            for view_name, counters in _stats.items()
+        ]
+
+
+class CachedListMixin:
+    """
+    ViewSet mixin caching `list()` responses.
+
+    - `cache_models`: models whose tables the list (including nested serializers) reads
+    - `cache_ttl`: seconds to keep an entry; None leaves the view uncached
+    """
+    cache_models = ()
+    cache_ttl = None
+
+    def list(self, request, *args, **kwargs):
+        if not queryset_cache_enabled() or not self.cache_ttl:
+            return super().list(request, *args, **kwargs)
+
+        view_name = type(self).__name__
+        key = self.get_list_cache_key(request)
+        cache = get_cache()
+
+        data = cache.get(key)
+        if data is not None:
+            record(view_name, hit=True)
+            return Response(data)
+
+        record(view_name, hit=False)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, self.cache_ttl)
+        return response
+
+    def get_list_cache_key(self, request) -> str:
+        role = resolve_role(request)
+        # Owners see every row of the tenant, so they share entries
+        scope = role if role == 'owner' else f'{role}:{request.user.pk}'
+        versions = get_table_versions(self.cache_models)
+        # Absolute URLs in the payload (e.g. profile pictures) depend on the host
+        request_id = hashlib.sha1(
+            f'{request.get_host()}{request.get_full_path()}'.encode()
+        ).hexdigest()
+        return ':'.join([
+            'qs', type(self).__name__, connection.schema_name, scope, *versions, request_id,
+        ])
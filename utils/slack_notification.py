@@ -1,11 +1,50 @@
 import requests
 import logging
 from typing import Optional, List, Dict, Any
+from django.conf import settings
+from django.db import connection
 from settings_app.models import SlackToken
 from project.models import ProjectSlackChannel
+from pms import invalidation
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+SLACK_TOKEN_TOPIC = 'slack_token'
+
+_NO_SLACK_TOKEN = object()
+
+# schema name -> the tenant's SlackToken, invalidated from settings_app.signals
+slack_token_cache = TTLCache(
+    maxsize=getattr(settings, 'TENANT_CACHE_MAX_ENTRIES', 1000),
+    ttl=getattr(settings, 'SLACK_TOKEN_CACHE_TTL', 300),
+    name='slack_token',
+)
+
+
+def get_slack_token() -> Optional[SlackToken]:
+    """
+    The current tenant's SlackToken (or None), cached per schema.
+    Treat the returned instance as read-only.
+    """
+    schema = connection.schema_name
+    cached = slack_token_cache.get(schema)
+    if cached is None:
+        slack_token = SlackToken.objects.first()
+        slack_token_cache.set(schema, slack_token if slack_token else _NO_SLACK_TOKEN)
+        return slack_token
+    return None if cached is _NO_SLACK_TOKEN else cached
+
+
+def _evict_slack_token(schema, key):
+    if key is None:
+        slack_token_cache.clear()
+    else:
+        slack_token_cache.delete(key)
+
+
+invalidation.register(SLACK_TOKEN_TOPIC, _evict_slack_token)
+
 
 def send_slack_message(
     channel_id: str,
@@ -25,7 +64,7 @@ def send_slack_message(
     """
     try:
         # Get the Slack token
-        slack_token = SlackToken.objects.first()
+        slack_token = get_slack_token()
         if not slack_token or not slack_token.is_connected:
             logger.warning("Slack is not connected. Cannot send message.")
             return False
@@ -74,7 +113,8 @@ def notify_project_update(project, updated_by, changes: Dict[str, tuple]) -> Non
     Args:
         project: The Project instance that was updated
         updated_by: The User who made the update
-        changes: Dictionary of field changes in format {field_name: (old_value, new_value)}
+        changes: Dictionary of field changes in format {field_name: (old_value, new_value)},
+            descriptions as their stored plain text (description_text)
     """
     try:
         # Get all Slack channels connected to this project
@@ -84,26 +124,11 @@ def notify_project_update(project, updated_by, changes: Dict[str, tuple]) -> Non
             logger.debug(f"No Slack channels connected to project {project.name}")
             return
         
-        # Helper function to strip HTML tags
-        def strip_html(text):
-            """Remove HTML tags from text"""
-            if not text or text == 'None':
-                return text
-            import re
-            # Remove HTML tags
-            clean = re.sub('<.*?>', '', str(text))
-            # Clean up extra whitespace
-            clean = ' '.join(clean.split())
-            return clean
-        
         # Build the change description
         change_lines = []
         for field, (old_val, new_val) in changes.items():
             field_display = field.replace('_', ' ').title()
-            # Strip HTML from values
-            clean_old = strip_html(old_val)
-            clean_new = strip_html(new_val)
-            change_lines.append(f"• *{field_display}*: {clean_old} → {clean_new}")
+            change_lines.append(f"• *{field_display}*: {old_val} → {new_val}")
         
         changes_text = "\n".join(change_lines)
         
@@ -241,12 +266,12 @@ def notify_project_created(project, created_by) -> None:
             }
         ]
         
-        if project.description:
+        if project.description_excerpt:
             blocks.append({
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*Description:*\n{project.description[:200]}{'...' if len(project.description) > 200 else ''}"
+                    "text": f"*Description:*\n{project.description_excerpt}"
                 }
             })
         
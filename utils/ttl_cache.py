@@ -0,0 +1,108 @@
+"""
+Small in-process LRU cache with a per-entry time-to-live.
+
+Used for hot, read-mostly lookups (client roles, users, tenants) that are
+safe to serve slightly stale and are explicitly invalidated from model
+signals when the underlying rows change.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+# name -> TTLCache, for every cache created with a name; used to report stats
+registry = {}
+
+
+class TTLCache:
+    """
+    Thread-safe, bounded LRU cache whose entries expire after `ttl` seconds.
+
+    - `maxsize` bounds memory: the least recently used entry is evicted first
+    - `ttl` bounds staleness for entries that are never invalidated explicitly
+    - hit/miss/eviction counters are kept so the cache can be sized from stats()
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, name: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if name:
+            registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Drop every key for which `predicate(key)` is true.
+        Linear in the cache size, so meant for (rare) invalidation paths only.
+        """
+        with self._lock:
+            doomed = [key for key in self._data if predicate(key)]
+            for key in doomed:
+                del self._data[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def all_stats() -> list:
+    """
+    stats() of every named cache in this process.
+    """
+    return [cache.stats() for cache in registry.values()]
@@ -0,0 +1,41 @@
+"""
+Typeahead matching backed by pg_trgm GIN indexes.
+
+Each searchable column has an index on `UPPER(column) gin_trgm_ops`, which
+serves both conditions built here:
+
+- prefix: `UPPER(column) LIKE 'TERM%'`, what Django emits for `__istartswith`
+- fuzzy: `UPPER(column) %> 'TERM'` (pg_trgm word similarity above
+  pg_trgm.word_similarity_threshold), for typos and mid-string words
+
+Matches are ranked prefix hits first, then by word similarity.
+"""
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Greatest, Upper
+
+# Below this many characters a term has no trigram worth comparing
+FUZZY_MIN_LENGTH = 3
+
+
+def typeahead(queryset, fields, term):
+    """
+    Rows of `queryset` where any of `fields` starts with or fuzzily matches
+    `term`, annotated with `prefix_match` and `similarity` and ordered by rank.
+    """
+    term = ' '.join(term.split()).upper()
+
+    prefix = reduce(or_, (Q(**{f'{field}__istartswith': term}) for field in fields))
+    condition = prefix
+    if len(term) >= FUZZY_MIN_LENGTH:
+        condition |= reduce(or_, (Q(TrigramWordSimilar(Upper(field), term)) for field in fields))
+
+    similarities = [TrigramWordSimilarity(term, Upper(field)) for field in fields]
+    return queryset.filter(condition).annotate(
+        prefix_match=ExpressionWrapper(prefix, output_field=BooleanField()),
+        similarity=Greatest(*similarities) if len(similarities) > 1 else similarities[0],
+    ).order_by('-prefix_match', '-similarity', 'pk')
@@ -0,0 +1,27 @@
+from rest_framework.response import Response
+
+
+class ValuesListMixin:
+    """
+    ViewSet mixin serving `list()` from values() rows instead of model instances.
+
+    - `values_serializer_class`: read-only serializer taking `context`, with
+      `values(queryset)` (the values() queryset to paginate) and
+      `to_representation(rows)` (the list of dicts to return)
+
+    Filtering, pagination and the response envelope stay those of the view.
+    Place it after CachedListMixin so cached responses skip it entirely.
+    """
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.values_serializer_class(context=self.get_serializer_context())
+        queryset = serializer.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(queryset))
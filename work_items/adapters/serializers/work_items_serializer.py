@@ -2,7 +2,8 @@ from user.models import UserProfile
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from project.models import Project
-from ...models import WorkItems
+from utils.includes import SparseFieldsMixin
+from ...models import WorkItems, prime_assignees
 
 class WorkItemUserProfileSerializer(serializers.ModelSerializer):
     class Meta:
@@ -20,13 +21,40 @@ class WorkItemProjectSerializer(serializers.ModelSerializer):
         model = Project
         fields = ['id', 'name',]
 
-class WorkItemsSerializer(serializers.ModelSerializer):
-    assigned_to = WorkItemUserSerializer(many=True, read_only=True)
+class WorkItemsListSerializer(serializers.ListSerializer):
+    """
+    Loads the assignees of the whole page in one query from `assignee_ids`
+    (unless ?fields= drops assigned_to).
+    """
+
+    def to_representation(self, data):
+        items = data.all() if hasattr(data, 'all') else data
+        if 'assigned_to' in self.child.fields:
+            items = prime_assignees(items)
+        return super().to_representation(items)
+
+
+class WorkItemsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    assigned_to = WorkItemUserSerializer(source='assignees', many=True, read_only=True)
     project = WorkItemProjectSerializer(read_only=True)
 
     class Meta:
         model = WorkItems
-        fields = '__all__'
+        # internal sort key / denormalized assigned_to / derived description columns / search index
+        exclude = ('priority_rank', 'assignee_ids', 'description_html', 'description_text', 'search_vector')
+        list_serializer_class = WorkItemsListSerializer
+
+
+class WorkItemsSummarySerializer(WorkItemsSerializer):
+    """
+    List representation: the plain-text `description_excerpt` instead of the HTML
+    `description`, which WorkItemsViewset defers (use ?include=description for it).
+    """
+
+    class Meta(WorkItemsSerializer.Meta):
+        exclude = (
+            'priority_rank', 'assignee_ids', 'description_html', 'description_text', 'search_vector', 'description',
+        )
 
 class WorkItemsWriteSerializer(serializers.ModelSerializer):
     class Meta:
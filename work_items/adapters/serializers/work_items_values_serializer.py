@@ -0,0 +1,143 @@
+from django.contrib.auth.models import User
+from rest_framework import serializers
+
+from project.models import Project
+from user.models import UserProfile
+from utils.fragment_cache import FragmentCache, fragment_cache_enabled
+from utils.includes import requested_fields, requested_includes
+
+# Same formatting as the ModelSerializer fields (settings, time zone, 'Z' suffix)
+_date_field = serializers.DateField()
+_datetime_field = serializers.DateTimeField()
+
+USER_COLUMNS = ('id', 'username', 'email', 'first_name', 'last_name', 'profile__id', 'profile__profile_picture')
+
+# Output field -> values() columns it needs, in WorkItemsSerializer field order
+FIELD_COLUMNS = {
+    'id': (),
+    'assigned_to': (),
+    'project': ('project_id', 'project__name'),
+    'title': ('title',),
+    'description': ('description',),
+    'description_excerpt': ('description_excerpt',),
+    'due_date': ('due_date',),
+    'status': ('status',),
+    'priority': ('priority',),
+    'created_at': ('created_at',),
+    'updated_at': (),
+}
+# Always fetched: the fragment cache key
+KEY_COLUMNS = ('id', 'updated_at', 'assignee_ids')
+
+
+class WorkItemsValuesSerializer:
+    """
+    Read-only, values()-based twin of WorkItemsSummarySerializer (or of
+    WorkItemsSerializer with ?include=description) for list actions.
+
+    Rows are fetched as dicts instead of model instances, the assignees of a
+    whole page come from one values() query keyed by `assignee_ids`, and the
+    JSON shape (key order included) matches the ModelSerializer output; see
+    WorkItemsValuesSerializerParityTests. `?fields=` narrows both the output
+    and the columns fetched; the project join and the user lookup only
+    happen for `project` and `assigned_to`.
+
+    Represented rows are kept in the fragment cache (utils.fragment_cache),
+    keyed by updated_at and assignee_ids, so unchanged rows skip the user
+    lookup and formatting.
+    """
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.request = self.context.get('request')
+        include_description = 'description' in requested_includes(self.request)
+        fields = requested_fields(self.request)
+        self.field_names = [
+            name for name in FIELD_COLUMNS
+            if (name != 'description' or include_description) and (fields is None or name in fields)
+        ]
+
+    def columns(self):
+        columns = list(KEY_COLUMNS)
+        for name in self.field_names:
+            columns.extend(FIELD_COLUMNS[name])
+        return columns
+
+    def fragment_models(self):
+        # Related tables embedded in the represented rows
+        models = []
+        if 'project' in self.field_names:
+            models.append(Project)
+        if 'assigned_to' in self.field_names:
+            models.extend((User, UserProfile))
+        return models
+
+    def values(self, queryset):
+        # Relations are joined or looked up explicitly below
+        return queryset.select_related(None).prefetch_related(None).values(*self.columns())
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        if not fragment_cache_enabled():
+            return self.represent_rows(rows)
+
+        fragments = FragmentCache(type(self).__name__, self.field_names, self.fragment_models(), self.request)
+        keys = [fragments.key(row['id'], row['updated_at'], *row['assignee_ids']) for row in rows]
+        cached = fragments.get_many(keys)
+
+        misses = {key: row for row, key in zip(rows, keys) if key not in cached}
+        fresh = dict(zip(misses, self.represent_rows(list(misses.values()))))
+        fragments.set_many(fresh)
+
+        return [cached[key] if key in cached else fresh[key] for key in keys]
+
+    def represent_rows(self, rows):
+        users = {}
+        if 'assigned_to' in self.field_names:
+            users = self.load_users({user_id for row in rows for user_id in row['assignee_ids']})
+        return [self.represent_row(row, users) for row in rows]
+
+    def represent_row(self, row, users):
+        data = {}
+        for name in self.field_names:
+            if name == 'assigned_to':
+                data[name] = [users[user_id] for user_id in row['assignee_ids'] if user_id in users]
+            elif name == 'project':
+                data[name] = (
+                    {'id': row['project_id'], 'name': row['project__name']}
+                    if row['project_id'] is not None else None
+                )
+            elif name == 'due_date':
+                data[name] = _date_field.to_representation(row[name])
+            elif name in ('created_at', 'updated_at'):
+                data[name] = _datetime_field.to_representation(row[name])
+            else:
+                data[name] = row[name]
+        return data
+
+    def load_users(self, user_ids):
+        if not user_ids:
+            return {}
+        return {
+            user['id']: {
+                'id': user['id'],
+                'username': user['username'],
+                'email': user['email'],
+                'first_name': user['first_name'],
+                'last_name': user['last_name'],
+                'profile': (
+                    {'profile_picture': self.picture_url(user['profile__profile_picture'])}
+                    if user['profile__id'] is not None else None
+                ),
+            }
+            for user in User.objects.filter(pk__in=user_ids).values(*USER_COLUMNS)
+        }
+
+    def picture_url(self, name):
+        # ImageField.to_representation without building a FieldFile
+        if not name:
+            return None
+        url = UserProfile._meta.get_field('profile_picture').storage.url(name)
+        if self.request is not None:
+            return self.request.build_absolute_uri(url)
+        return url
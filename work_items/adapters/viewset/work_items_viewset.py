@@ -1,66 +1,112 @@
 from drf_spectacular.utils import extend_schema
-from rest_framework import viewsets, filters, status
+from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
 from project.permission import ProjectAccessPermission
-from customer.models import ActiveClient, UserClientRole
+from customer.access import resolve_role
 from pms.jwt_auth import CookieJWTAuthentication
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from utils.custom_paginator import CustomPaginator
+from utils.ordering_filter import MappedOrderingFilter
+from utils.queryset_cache import CachedListMixin
+from utils.conditional_get import ConditionalGetMixin
+from utils.columnar_renderer import ColumnarJSONRenderer
+from utils.values_list import ValuesListMixin
+from utils.includes import QueryFieldsMixin, field_requested, requested_includes
+from utils.full_text_search import FullTextSearchFilter
 from django.http import HttpResponse, JsonResponse
 from ...models import WorkItems
-from ..serializers.work_items_serializer import WorkItemsSerializer, WorkItemsWriteSerializer
+from ..serializers.work_items_serializer import WorkItemsSerializer, WorkItemsSummarySerializer, WorkItemsWriteSerializer
+from ..serializers.work_items_values_serializer import WorkItemsValuesSerializer
 from django_filters.rest_framework import DjangoFilterBackend
 from ...permission import WorkItemAccessPermission
-from django.db.models import Q
+from ...filters import WorkItemsFilter
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q
+from project.models import Project, ProjectMembers
+from django.contrib.auth.models import User
+from user.models import UserProfile
 
-class WorkItemsViewset(viewsets.ModelViewSet):
+
+def visibility_flags(user):
+    """
+    EXISTS subqueries flagging whether `user` is assigned to the work item
+    and whether they are a member of its project. Annotated on the queryset
+    so WorkItemAccessPermission needs no extra queries, and filtered on to
+    scope member/viewer lists (no fan-out joins, so no DISTINCT needed).
+    """
+    return {
+        "is_assigned": ExpressionWrapper(
+            Q(assignee_ids__contains=[user.pk]), output_field=BooleanField()
+        ),
+        "in_project": Exists(
+            ProjectMembers.objects.filter(project_id=OuterRef("project_id"), user_id=user.pk)
+        ),
+    }
+
+
+class WorkItemsViewset(QueryFieldsMixin, ConditionalGetMixin, CachedListMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = WorkItems.objects.all().order_by("-id")
     serializer_class = WorkItemsSerializer
+    # ?include=description returns the HTML on lists
+    include_options = ("description",)
+    # Lists skip model instances, see WorkItemsValuesSerializer
+    values_serializer_class = WorkItemsValuesSerializer
     authentication_classes = [CookieJWTAuthentication]
     permission_classes = [IsAuthenticated, WorkItemAccessPermission]
     pagination_class = CustomPaginator
+    cursor_ordering = ("-id",)
+    count_strategy = "estimated"
+    cache_models = (WorkItems, WorkItems.assigned_to.through, Project, ProjectMembers, User, UserProfile)
+    cache_ttl = 30
 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["project", "status", "priority", "assigned_to"]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, MappedOrderingFilter]
+    filterset_class = WorkItemsFilter
     search_fields = ["title", "description"]
+    search_vector_field = "search_vector"
     ordering_fields = ["due_date", "created_at", "updated_at", "priority", "title"]
+    ordering_field_map = {"priority": "priority_rank"}
     ordering = ["-created_at"]
 
+    # ?format=columnar, see utils.columnar_renderer
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+    columnar_references = {"assigned_to": "users", "project": "projects"}
+
     def get_queryset(self):
         user = self.request.user
-
-        active = ActiveClient.objects.select_related("client").filter(user=user).first()
-        if not active:
-            return WorkItems.objects.none()
-
-        role = (
-            UserClientRole.objects
-            .filter(user=user, client=active.client)
-            .values_list("role", flat=True)
-            .first()
-        )
+        role = resolve_role(self.request)
         if not role:
             return WorkItems.objects.none()
 
         qs = WorkItems.objects.all()
 
         if role in ("member", "viewer"):
-            qs = qs.filter(
-                Q(project__projectmembers__user=user) | Q(assigned_to=user)
+            qs = qs.annotate(**visibility_flags(user)).filter(
+                Q(is_assigned=True) | Q(in_project=True)
             )
 
-        # Performance: avoid N+1
-        qs = qs.select_related("project").prefetch_related(
-            "assigned_to",
-            "project__projectmembers_set__user",
-            "project__projectmembers_set__user__profile",
-        )
+        # Only load the relations the response carries (?fields=); lists
+        # are served by WorkItemsValuesSerializer, which joins its own
+        if field_requested(self.request, "project"):
+            qs = qs.select_related("project")
+        if self.action != "list" and field_requested(self.request, "assigned_to"):
+            qs = qs.prefetch_related("assigned_to__profile")
+
+        # The tsvector is only read by ?search= filtering
+        qs = qs.defer("search_vector")
+        if self.lists_summaries():
+            # Summernote HTML can be large; lists return description_excerpt
+            qs = qs.defer("description")
+
+        return qs.order_by("-id")
 
-        return qs.distinct().order_by("-id")
+    def lists_summaries(self):
+        return self.action == "list" and "description" not in requested_includes(self.request)
 
     def get_serializer_class(self):
         if self.action in ("create", "update", "partial_update"):
             return WorkItemsWriteSerializer
+        if self.lists_summaries():
+            return WorkItemsSummarySerializer
         return WorkItemsSerializer
 
     @extend_schema(
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkItemsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'work_items'
+
+    def ready(self):
+        from work_items import signals  # noqa: F401
@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from django_filters import rest_framework as filters
+
+from work_items.models import WorkItems
+
+
+class WorkItemsFilter(filters.FilterSet):
+    """
+    Same filters as `filterset_fields = ["project", "status", "priority", "assigned_to"]`,
+    but `assigned_to` (any of the given users) is answered from the GIN-indexed
+    `assignee_ids` array instead of joining the M2M table and deduplicating.
+    """
+    assigned_to = filters.ModelMultipleChoiceFilter(
+        queryset=User.objects.all(),
+        method='filter_assigned_to',
+    )
+
+    class Meta:
+        model = WorkItems
+        fields = ["project", "status", "priority", "assigned_to"]
+
+    def filter_assigned_to(self, queryset, name, value):
+        if not value:
+            return queryset
+        return queryset.filter(assignee_ids__overlap=[user.pk for user in value])
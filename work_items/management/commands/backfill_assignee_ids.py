@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from customer.models import Client
+from work_items.models import WorkItems
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-sync WorkItems.assignee_ids from the assigned_to M2M in primary key batches, "
+        "for one or every tenant schema. Safe to re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', action='append', help='Schema to backfill (repeatable, defaults to every tenant)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Work items per UPDATE')
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between batches')
+
+    def handle(self, *args, **options):
+        schemas = options['schema'] or list(
+            Client.objects.exclude(schema_name=get_public_schema_name())
+            .order_by('schema_name')
+            .values_list('schema_name', flat=True)
+        )
+        if not schemas:
+            raise CommandError('No tenant schemas found')
+
+        batch_size = options['batch_size']
+        for schema in schemas:
+            with schema_context(schema):
+                bounds = WorkItems.objects.aggregate(low=Min('pk'), high=Max('pk'))
+                if bounds['low'] is None:
+                    self.stdout.write(f'{schema}: no work items')
+                    continue
+
+                updated = 0
+                for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+                    updated += WorkItems.objects.filter(
+                        pk__gte=start, pk__lt=start + batch_size
+                    ).sync_assignee_ids()
+                    if options['pause']:
+                        time.sleep(options['pause'])
+
+                self.stdout.write(f'{schema}: synced {updated} work items')
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django_tenants.utils import schema_context
+from rest_framework.request import Request
+
+from customer.models import Client
+from work_items.adapters.serializers.work_items_serializer import WorkItemsSummarySerializer
+from work_items.adapters.serializers.work_items_values_serializer import WorkItemsValuesSerializer
+from work_items.models import WorkItems, prime_assignees
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare serializing a page of work items with WorkItemsSummarySerializer "
+        "(model instances) and WorkItemsValuesSerializer (values() rows), queries included."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', required=True, help='Tenant schema to benchmark in')
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=20, help='Timed runs per serializer')
+
+    def handle(self, *args, **options):
+        if not Client.objects.filter(schema_name=options['schema']).exists():
+            raise CommandError(f'Unknown tenant schema "{options["schema"]}"')
+
+        with schema_context(options['schema']):
+            page_size = options['page_size']
+            if not WorkItems.objects.exists():
+                raise CommandError('No work items, seed some with `bench_pagination --seed`')
+
+            request = Request(RequestFactory().get('/api/v1/work-items/', HTTP_HOST='localhost'))
+            context = {'request': request}
+            queryset = WorkItems.objects.select_related('project').defer('description').order_by('-id')
+
+            def model_path():
+                page = prime_assignees(queryset[:page_size])
+                return WorkItemsSummarySerializer(page, many=True, context=context).data
+
+            def values_path():
+                serializer = WorkItemsValuesSerializer(context=context)
+                return serializer.to_representation(serializer.values(queryset)[:page_size])
+
+            model_ms = self.best_of(options['repeat'], model_path)
+            values_ms = self.best_of(options['repeat'], values_path)
+
+            self.stdout.write(f'page of {page_size} work items, best of {options["repeat"]}')
+            self.stdout.write(f'{"serializer":>28} {"ms":>10} {"pages/s":>10}')
+            for name, ms in (('WorkItemsSummarySerializer', model_ms), ('WorkItemsValuesSerializer', values_ms)):
+                self.stdout.write(f'{name:>28} {ms:>10.2f} {1000 / ms:>10.1f}')
+            self.stdout.write(f'speedup: {model_ms / values_ms:.1f}x')
+
+    def best_of(self, repeat, run):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
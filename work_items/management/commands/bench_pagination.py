@@ -0,0 +1,101 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django_tenants.utils import schema_context
+from rest_framework.request import Request
+
+from customer.models import Client
+from utils.custom_paginator import COUNT_EXACT, CustomPaginator
+from work_items.adapters.viewset.work_items_viewset import WorkItemsViewset
+from work_items.models import WorkItems
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare page-number (COUNT + OFFSET) and keyset (cursor) pagination of work items "
+        "at increasing depths. Use --seed to grow the tenant's table to --rows first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', required=True, help='Tenant schema to benchmark in')
+        parser.add_argument('--rows', type=int, default=1_000_000, help='Target row count when seeding')
+        parser.add_argument('--seed', action='store_true', help='Insert synthetic work items up to --rows')
+        parser.add_argument('--page-size', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per depth')
+
+    def handle(self, *args, **options):
+        if not Client.objects.filter(schema_name=options['schema']).exists():
+            raise CommandError(f'Unknown tenant schema "{options["schema"]}"')
+
+        with schema_context(options['schema']):
+            if options['seed']:
+                self.seed(options['rows'])
+
+            total = WorkItems.objects.count()
+            if not total:
+                raise CommandError('No work items, pass --seed')
+
+            page_size = options['page_size']
+            last_page = (total - 1) // page_size + 1
+            depths = sorted({1, 10, 1000, last_page // 2, last_page} & set(range(1, last_page + 1)))
+
+            self.stdout.write(f'{total} work items, page size {page_size}\n')
+            self.stdout.write(f'{"page":>10} {"page-number ms":>16} {"cursor ms":>12}')
+            for page in depths:
+                offset_ms = self.time_page_number(page, page_size, options['repeat'])
+                cursor_ms = self.time_cursor(page, page_size, options['repeat'])
+                self.stdout.write(f'{page:>10} {offset_ms:>16.2f} {cursor_ms:>12.2f}')
+
+    def seed(self, rows):
+        missing = rows - WorkItems.objects.count()
+        batch_size = 10_000
+        while missing > 0:
+            batch = min(batch_size, missing)
+            WorkItems.objects.bulk_create(
+                WorkItems(
+                    title=f'Synthetic work item {i}',
+                    description='<p>Synthetic work item</p>',
+                    due_date=date(2030, 1, 1),
+                )
+                for i in range(batch)
+            )
+            missing -= batch
+            self.stdout.write(f'seeded, {max(missing, 0)} to go')
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {WorkItems._meta.db_table}')
+
+    def paginate(self, query_string):
+        view = WorkItemsViewset()
+        # The view estimates its counts; time the COUNT(*) the page-number column stands for
+        view.count_strategy = COUNT_EXACT
+        request = Request(RequestFactory().get(f'/api/v1/work-items/?{query_string}', HTTP_HOST='localhost'))
+        paginator = CustomPaginator()
+        queryset = WorkItems.objects.all().order_by(*view.cursor_ordering)
+        page = paginator.paginate_queryset(queryset, request, view)
+        paginator.get_paginated_response([item.pk for item in page])
+
+    def time_page_number(self, page, page_size, repeat):
+        return self.best_of(repeat, lambda: self.paginate(f'page={page}&page_size={page_size}'))
+
+    def time_cursor(self, page, page_size, repeat):
+        if page == 1:
+            query_string = f'pagination=cursor&page_size={page_size}'
+        else:
+            # The row just before the page, as the previous page's next link would carry it
+            last_id = WorkItems.objects.order_by('-id').values_list('id', flat=True)[(page - 1) * page_size - 1]
+            paginator = CustomPaginator()
+            paginator.request = Request(RequestFactory().get('/api/v1/work-items/', HTTP_HOST='localhost'))
+            link = paginator.encode_cursor([last_id], reverse=False)
+            query_string = f'{link.split("?", 1)[1]}&page_size={page_size}'
+        return self.best_of(repeat, lambda: self.paginate(query_string))
+
+    def best_of(self, repeat, run):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
@@ -0,0 +1,125 @@
+import random
+import time
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+from django_tenants.utils import schema_context
+
+from customer.models import Client
+from project.models import Project, ProjectMembers
+from work_items.adapters.viewset.work_items_viewset import visibility_flags
+from work_items.models import WorkItems
+
+BENCH_USERNAME = 'bench-visibility-member'
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN ANALYZE the member/viewer work item scoping: the former OR-join + DISTINCT "
+        "query vs the EXISTS-based one used by WorkItemsViewset. Use --seed to create "
+        "a synthetic member, projects and work items in the tenant first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', required=True, help='Tenant schema to explain in')
+        parser.add_argument('--user', help=f'Username to scope for (defaults to {BENCH_USERNAME})')
+        parser.add_argument('--seed', action='store_true', help='Seed --work-items synthetic work items')
+        parser.add_argument('--work-items', type=int, default=100_000)
+        parser.add_argument('--projects', type=int, default=200)
+        parser.add_argument('--page-size', type=int, default=10)
+
+    def handle(self, *args, **options):
+        if not Client.objects.filter(schema_name=options['schema']).exists():
+            raise CommandError(f'Unknown tenant schema "{options["schema"]}"')
+
+        with schema_context(options['schema']):
+            if options['seed']:
+                self.seed(options['work_items'], options['projects'])
+
+            username = options['user'] or BENCH_USERNAME
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f'No user "{username}", pass --seed or --user')
+
+            page_size = options['page_size']
+            before = (
+                WorkItems.objects.filter(Q(project__projectmembers__user=user) | Q(assigned_to=user))
+                .distinct().order_by('-id')
+            )
+            after = (
+                WorkItems.objects.annotate(**visibility_flags(user))
+                .filter(Q(is_assigned=True) | Q(in_project=True))
+                .order_by('-id')
+            )
+
+            # Both plans must scope to the same rows for the timings to compare
+            before_count, after_count = before.count(), after.count()
+            if before_count != after_count:
+                raise CommandError(
+                    f'OR-join returns {before_count} work items but EXISTS {after_count}; '
+                    f'run backfill_assignee_ids --schema {options["schema"]}'
+                )
+
+            for label, queryset in (('OR-join + DISTINCT', before), ('EXISTS', after)):
+                self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {label}: first page =='))
+                self.explain(queryset[:page_size])
+                self.stdout.write(self.style.MIGRATE_HEADING(f'== {label}: count =='))
+                self.explain(queryset.order_by().values('pk'), count=True)
+
+    def explain(self, queryset, count=False):
+        sql, params = queryset.query.sql_with_params()
+        if count:
+            sql = f'SELECT COUNT(*) FROM ({sql}) counted'
+        with connection.cursor() as cursor:
+            started = time.perf_counter()
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {sql}', params)
+            elapsed = (time.perf_counter() - started) * 1000
+            for (line,) in cursor.fetchall():
+                self.stdout.write(line)
+        self.stdout.write(f'-- {elapsed:.1f} ms round trip\n')
+
+    def seed(self, work_items, projects):
+        rng = random.Random(13)
+        user, _ = User.objects.get_or_create(
+            username=BENCH_USERNAME, defaults={'email': f'{BENCH_USERNAME}@example.com'}
+        )
+
+        project_objs = Project.objects.bulk_create(
+            Project(name=f'Synthetic project {i}') for i in range(projects)
+        )
+        # Member of 10% of the projects
+        ProjectMembers.objects.bulk_create(
+            (ProjectMembers(project=project, user=user, role='member')
+             for project in rng.sample(project_objs, max(1, projects // 10))),
+            ignore_conflicts=True,
+        )
+
+        created = 0
+        batch_size = 10_000
+        Assignment = WorkItems.assigned_to.through
+        while created < work_items:
+            batch = WorkItems.objects.bulk_create(
+                WorkItems(
+                    title=f'Synthetic work item {created + i}',
+                    description='<p>Synthetic work item</p>',
+                    due_date=date(2030, 1, 1),
+                    project=rng.choice(project_objs),
+                )
+                for i in range(min(batch_size, work_items - created))
+            )
+            # Directly assigned to 1% of the work items
+            Assignment.objects.bulk_create(
+                Assignment(workitems_id=item.pk, user_id=user.pk)
+                for item in batch if rng.random() < 0.01
+            )
+            # bulk_create() sends no m2m_changed; the EXISTS plan reads assignee_ids
+            WorkItems.objects.filter(pk__in=[item.pk for item in batch]).sync_assignee_ids()
+            created += len(batch)
+            self.stdout.write(f'seeded {created}/{work_items} work items')
+
+        with connection.cursor() as cursor:
+            for model in (Project, ProjectMembers, WorkItems, Assignment):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
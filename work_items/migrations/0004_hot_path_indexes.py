@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:53
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('project', '0009_hot_path_indexes'),
+        ('work_items', '0003_alter_workitems_options_alter_workitems_priority_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='workitems',
+            index=models.Index(fields=['status', 'due_date'], name='workitem_status_due_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='workitems',
+            index=models.Index(fields=['status', 'updated_at'], name='workitem_status_updated_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='workitems',
+            index=models.Index(fields=['project', '-created_at'], name='workitem_project_created_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:54
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Stored generated column (rewrites the table once), then a concurrent index build
+    atomic = False
+
+    dependencies = [
+        ('project', '0010_priority_rank'),
+        ('work_items', '0004_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workitems',
+            name='priority_rank',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(priority='high', then=models.Value(3)), models.When(priority='medium', then=models.Value(2)), models.When(priority='low', then=models.Value(1)), default=models.Value(0)), output_field=models.PositiveSmallIntegerField()),
+        ),
+        AddIndexConcurrently(
+            model_name='workitems',
+            index=models.Index(fields=['priority_rank', 'id'], name='workitem_priority_rank_idx'),
+        ),
+    ]
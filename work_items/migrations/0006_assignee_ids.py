@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:55
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Each statement commits on its own; the index is built concurrently
+    atomic = False
+
+    dependencies = [
+        ('project', '0010_priority_rank'),
+        ('work_items', '0005_priority_rank'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workitems',
+            name='assignee_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, size=None),
+        ),
+        # Initial backfill; `manage.py backfill_assignee_ids` re-syncs in batches
+        migrations.RunSQL(
+            sql='''
+                UPDATE work_items_workitems w
+                SET assignee_ids = ARRAY(
+                    SELECT a.user_id FROM work_items_workitems_assigned_to a
+                    WHERE a.workitems_id = w.id ORDER BY a.user_id
+                )
+                WHERE EXISTS (
+                    SELECT 1 FROM work_items_workitems_assigned_to a WHERE a.workitems_id = w.id
+                );
+            ''',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        AddIndexConcurrently(
+            model_name='workitems',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['assignee_ids'], name='workitem_assignee_ids_gin'),
+        ),
+    ]
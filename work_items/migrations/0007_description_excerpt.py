@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:56
+
+from django.db import migrations, models
+
+from utils.description import html_to_text, make_excerpt
+
+
+def backfill_excerpts(apps, schema_editor):
+    WorkItems = apps.get_model('work_items', 'WorkItems')
+    batch = []
+    for row in WorkItems.objects.only('id', 'description').iterator(chunk_size=2000):
+        row.description_excerpt = make_excerpt(html_to_text(row.description))
+        batch.append(row)
+        if len(batch) >= 2000:
+            WorkItems.objects.bulk_update(batch, ['description_excerpt'])
+            batch = []
+    if batch:
+        WorkItems.objects.bulk_update(batch, ['description_excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    # Batches of the backfill commit on their own
+    atomic = False
+
+    dependencies = [
+        ('work_items', '0006_assignee_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workitems',
+            name='description_excerpt',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work_items', '0007_description_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workitems',
+            name='description_html',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='workitems',
+            name='description_text',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
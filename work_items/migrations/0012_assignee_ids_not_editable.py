@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 02:30
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('work_items', '0011_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='workitems',
+            name='assignee_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+    ]
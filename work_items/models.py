@@ -1,6 +1,15 @@
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import Case, OuterRef, Value, When
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 
+from utils.description import update_description_fields
+from utils.full_text_search import SEARCH_CONFIG
+
 class Status(models.TextChoices):
     PENDING = 'pending', 'Pending'
     IN_PROGRESS = 'in_progress', 'In Progress'
@@ -11,22 +20,113 @@ class Priority(models.TextChoices):
     MEDIUM = 'medium', 'Medium'
     HIGH = 'high', 'High'
 
+class WorkItemsQuerySet(models.QuerySet):
+
+    def sync_assignee_ids(self):
+        """
+        Recompute `assignee_ids` from the assigned_to M2M for every row, in one UPDATE.
+        Uses update(), so neither post_save nor `updated_at` fire.
+        """
+        assignees = WorkItems.assigned_to.through.objects.filter(
+            workitems_id=OuterRef('pk')
+        ).order_by('user_id').values('user_id')
+        return self.update(assignee_ids=ArraySubquery(assignees))
+
+
+def prime_assignees(work_items):
+    """
+    Load the assignees (with profiles) of many work items in one query from
+    their `assignee_ids`, so serializing `assignees` needs no M2M join.
+    """
+    work_items = list(work_items)
+    user_ids = {user_id for item in work_items for user_id in item.assignee_ids}
+    users = User.objects.select_related('profile').in_bulk(user_ids) if user_ids else {}
+    for item in work_items:
+        item._assignees = [users[user_id] for user_id in item.assignee_ids if user_id in users]
+    return work_items
+
+
 # Create your models here.
 class WorkItems(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField()
+    # Derived from `description` on save, see utils.description
+    description_html = models.TextField(blank=True, default='')
+    description_text = models.TextField(blank=True, default='')
+    # Plain-text start of `description`, served by list endpoints instead of the HTML
+    description_excerpt = models.CharField(max_length=255, blank=True, default='')
     due_date = models.DateField()
     status = models.CharField(max_length=50, choices=Status.choices, default=Status.PENDING)
     priority = models.CharField(max_length=50, choices=Priority.choices, default=Priority.LOW)
+    # 1 = low .. 3 = high, so priority sorts by rank; see MappedOrderingFilter
+    priority_rank = models.GeneratedField(
+        expression=Case(
+            When(priority='high', then=Value(3)),
+            When(priority='medium', then=Value(2)),
+            When(priority='low', then=Value(1)),
+            default=Value(0),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
     project = models.ForeignKey('project.Project', on_delete=models.CASCADE, null=True, blank=True)
     assigned_to = models.ManyToManyField(User, related_name='assigned_work_items', blank=True)
+    # Denormalized assigned_to user ids, written only by sync_assignee_ids()
+    # (see work_items.signals); GIN-indexed so assignee filters need no M2M join
+    assignee_ids = ArrayField(models.IntegerField(), default=list, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Full-text search document, maintained by Postgres; see utils.full_text_search
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('description_text', weight='B', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
+    objects = WorkItemsQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # A full save of a stale instance must not write back old assignee ids;
+        # unloaded (deferred) fields stay untouched, as in a plain save()
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated
+                and field.name != 'assignee_ids' and field.attname not in deferred
+            ]
+        update_description_fields(self, kwargs)
+        super().save(*args, **kwargs)
+
+    @property
+    def assignees(self):
+        """
+        Assigned users: primed by prime_assignees() for lists, else the M2M.
+        """
+        if hasattr(self, '_assignees'):
+            return self._assignees
+        return self.assigned_to.all()
+
     class Meta:
         verbose_name_plural = "Work Items"
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+        indexes = [
+            # dashboard due / overdue / completed-this-week cards
+            models.Index(fields=['status', 'due_date'], name='workitem_status_due_idx'),
+            models.Index(fields=['status', 'updated_at'], name='workitem_status_updated_idx'),
+            # work items of a project, newest first
+            models.Index(fields=['project', '-created_at'], name='workitem_project_created_idx'),
+            # ?ordering=priority / -priority
+            models.Index(fields=['priority_rank', 'id'], name='workitem_priority_rank_idx'),
+            # assigned_to filters: assignee_ids && ARRAY[...] / @> ARRAY[...]
+            GinIndex(fields=['assignee_ids'], name='workitem_assignee_ids_gin'),
+            GinIndex(fields=['search_vector'], name='workitem_search_vector_gin'),
+            # Typeahead prefix and fuzzy matching, see utils.typeahead
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='workitem_title_trgm_idx'),
+        ]
\ No newline at end of file
@@ -1,6 +1,5 @@
-from django.db.models import Q
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from customer.models import ActiveClient, UserClientRole
+from customer.access import resolve_role
 
 
 class WorkItemAccessPermission(BasePermission):
@@ -12,41 +11,33 @@ class WorkItemAccessPermission(BasePermission):
     viewer: read-only if (assigned_to) OR (project membership)
     """
 
-    def _get_role(self, user):
-        active = ActiveClient.objects.select_related("client").filter(user=user).first()
-        if not active:
-            return None, None
-
-        role = (
-            UserClientRole.objects
-            .filter(user=user, client=active.client)
-            .values_list("role", flat=True)
-            .first()
-        )
-        return active, role
-
     def has_permission(self, request, view):
         user = getattr(request, "user", None)
         if not user or user.is_anonymous:
             return False
 
-        _, role = self._get_role(user)
-        return bool(role)
+        return bool(resolve_role(request))
 
     def has_object_permission(self, request, view, obj):
         user = request.user
-        active, role = self._get_role(user)
-        if not active or not role:
+        role = resolve_role(request)
+        if not role:
             return False
 
         if role == "owner":
             return True
 
-        # Conditions: assigned directly OR belongs to project team
-        is_assigned = obj.assigned_to.filter(id=user.id).exists()
-        in_project = False
-        if obj.project_id:
-            in_project = obj.project.projectmembers_set.filter(user=user).exists()
+        # Conditions: assigned directly OR belongs to project team.
+        # WorkItemsViewset annotates both flags; only query when they are missing.
+        is_assigned = getattr(obj, "is_assigned", None)
+        if is_assigned is None:
+            is_assigned = user.id in obj.assignee_ids
+
+        in_project = getattr(obj, "in_project", None)
+        if in_project is None:
+            in_project = False
+            if obj.project_id:
+                in_project = obj.project.projectmembers_set.filter(user=user).exists()
 
         allowed = is_assigned or in_project
 
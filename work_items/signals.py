@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from customer.models import Client
+from utils.queryset_cache import invalidate_table
+from work_items.models import WorkItems
+
+
+@receiver([post_save, post_delete], sender=WorkItems)
+def work_item_changed(sender, instance, **kwargs):
+    invalidate_table(WorkItems)
+
+
+@receiver(m2m_changed, sender=WorkItems.assigned_to.through)
+def work_item_assignees_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep WorkItems.assignee_ids in sync with the assigned_to M2M, from either side.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        WorkItems.objects.filter(pk=instance.pk).sync_assignee_ids()
+        # A later save() of this instance must not write back the old ids
+        instance.assignee_ids = WorkItems.objects.values_list('assignee_ids', flat=True).get(pk=instance.pk)
+    elif action == 'post_clear':
+        # user.assigned_work_items.clear(): the stale rows still list the user
+        WorkItems.objects.filter(assignee_ids__contains=[instance.pk]).sync_assignee_ids()
+    else:
+        WorkItems.objects.filter(pk__in=pk_set).sync_assignee_ids()
+
+    invalidate_table(sender)
+
+
+@receiver(post_delete, sender=User)
+def assignee_deleted(sender, instance, **kwargs):
+    """
+    Users are shared by every tenant, but the delete only cascades to the M2M
+    rows of the current schema (and without m2m_changed). Drop the user's
+    assignments and id from the work items of every tenant schema.
+    """
+    schemas = Client.objects.exclude(schema_name=get_public_schema_name()).values_list('schema_name', flat=True)
+    for schema in schemas:
+        with schema_context(schema):
+            removed, _ = WorkItems.assigned_to.through.objects.filter(user_id=instance.pk).delete()
+            if WorkItems.objects.filter(assignee_ids__contains=[instance.pk]).sync_assignee_ids() or removed:
+                invalidate_table(WorkItems)
+                invalidate_table(WorkItems.assigned_to.through)
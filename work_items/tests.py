@@ -1,3 +1,363 @@
-from django.test import TestCase
+import json
+from datetime import date
 
-# Create your tests here.
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+
+from project.models import Project, ProjectActivityLog, ProjectMembers
+from project.tests import PmsTenantTestCase, count_membership_checks
+from user.models import UserProfile
+from work_items.adapters.serializers.work_items_serializer import WorkItemsSerializer, WorkItemsSummarySerializer
+from work_items.models import WorkItems, prime_assignees
+
+
+class WorkItemVisibilityTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.other = self.create_user('other', 'member')
+
+        mine = Project.objects.create(name='Apollo')
+        theirs = Project.objects.create(name='Gemini')
+        ProjectMembers.objects.create(project=mine, user=self.member, role='member')
+        ProjectMembers.objects.create(project=mine, user=self.other, role='member')
+        ProjectMembers.objects.create(project=theirs, user=self.other, role='member')
+
+        self.in_project = self.create_item('In my project', mine)
+        self.assigned = self.create_item('Assigned to me', theirs, self.member)
+        self.both = self.create_item('Both', mine, self.member, self.other)
+        self.hidden = self.create_item('Hidden', theirs, self.other)
+        self.login(self.member)
+
+    def create_item(self, title, project, *assignees):
+        item = WorkItems.objects.create(title=title, description='', due_date=date(2030, 1, 1), project=project)
+        item.assigned_to.set(assignees)
+        return item
+
+    def test_member_sees_project_and_assigned_items_once(self):
+        body = self.client.get('/api/v1/work-items/').json()
+
+        self.assertEqual(
+            [row['id'] for row in body['results']],
+            [self.both.pk, self.assigned.pk, self.in_project.pk],
+        )
+        self.assertEqual(body['total_items'], 3)
+
+    def test_member_cannot_fetch_hidden_item(self):
+        response = self.client.get(f'/api/v1/work-items/{self.hidden.pk}/')
+        self.assertEqual(response.status_code, 404)
+
+
+class WorkItemPermissionQueryCountTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=project, user=self.member, role='member')
+        self.item = WorkItems.objects.create(title='Launch', description='', due_date=date(2030, 1, 1), project=project)
+        self.login(self.member)
+
+    def assert_no_membership_checks(self, method, expected_status, **kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(f'/api/v1/work-items/{self.item.pk}/', **kwargs)
+
+        self.assertEqual(response.status_code, expected_status)
+        self.assertEqual(count_membership_checks(ctx.captured_queries), 0)
+
+    def test_retrieve(self):
+        self.assert_no_membership_checks('get', 200)
+
+    def test_partial_update(self):
+        self.assert_no_membership_checks(
+            'patch', 200, data=json.dumps({'title': 'Liftoff'}), content_type='application/json',
+        )
+
+    def test_destroy(self):
+        self.assert_no_membership_checks('delete', 204)
+
+
+class PriorityOrderingTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        for priority in ('medium', 'high', 'low', 'high'):
+            WorkItems.objects.create(title=priority, description='', due_date=date(2030, 1, 1), priority=priority)
+        self.login(self.owner)
+
+    def test_priority_orders_by_rank(self):
+        body = self.client.get('/api/v1/work-items/?ordering=-priority').json()
+
+        self.assertEqual([row['priority'] for row in body['results']], ['high', 'high', 'medium', 'low'])
+        self.assertNotIn('priority_rank', body['results'][0])
+
+
+class AssigneeIdsSyncTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        self.alice = self.create_user('alice', 'member')
+        self.bob = self.create_user('bob', 'member')
+        self.item = WorkItems.objects.create(title='Ship', description='', due_date=date(2030, 1, 1))
+
+    def assignee_ids(self):
+        return WorkItems.objects.values_list('assignee_ids', flat=True).get(pk=self.item.pk)
+
+    def test_forward_and_reverse_changes_are_synced(self):
+        self.item.assigned_to.add(self.bob, self.alice)
+        self.assertEqual(self.assignee_ids(), sorted([self.alice.pk, self.bob.pk]))
+        self.assertEqual(self.item.assignee_ids, sorted([self.alice.pk, self.bob.pk]))
+
+        self.alice.assigned_work_items.remove(self.item)
+        self.assertEqual(self.assignee_ids(), [self.bob.pk])
+
+        self.bob.assigned_work_items.clear()
+        self.assertEqual(self.assignee_ids(), [])
+
+    def test_saving_stale_instance_keeps_assignee_ids(self):
+        stale = WorkItems.objects.get(pk=self.item.pk)
+        self.item.assigned_to.add(self.alice)
+
+        stale.title = 'Ship it'
+        stale.save()
+
+        self.assertEqual(self.assignee_ids(), [self.alice.pk])
+        self.assertEqual(WorkItems.objects.get(pk=self.item.pk).title, 'Ship it')
+
+    def test_deleted_user_is_dropped_from_assignee_ids(self):
+        self.item.assigned_to.add(self.alice, self.bob)
+
+        self.alice.delete()
+
+        self.assertEqual(self.assignee_ids(), [self.bob.pk])
+
+    def test_assigned_to_filter_uses_array(self):
+        self.item.assigned_to.add(self.alice)
+        WorkItems.objects.create(title='Other', description='', due_date=date(2030, 1, 1))
+        self.login(self.owner)
+
+        body = self.client.get(f'/api/v1/work-items/?assigned_to={self.alice.pk}').json()
+
+        self.assertEqual([row['id'] for row in body['results']], [self.item.pk])
+        self.assertEqual([user['id'] for user in body['results'][0]['assigned_to']], [self.alice.pk])
+
+
+class DescriptionExcerptTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        self.item = WorkItems.objects.create(
+            title='Ship', description='<p>Ship the <b>release</b> &amp; tag it</p>' + '<p>more</p>' * 100,
+            due_date=date(2030, 1, 1),
+        )
+        self.login(self.owner)
+
+    def test_excerpt_is_stored_on_save(self):
+        self.assertTrue(self.item.description_excerpt.startswith('Ship the release & tag it more'))
+        self.assertLessEqual(len(self.item.description_excerpt), 200)
+
+    def test_list_returns_excerpt_instead_of_html(self):
+        row = self.client.get('/api/v1/work-items/').json()['results'][0]
+
+        self.assertNotIn('description', row)
+        self.assertEqual(row['description_excerpt'], self.item.description_excerpt)
+
+    def test_html_is_available_on_request_and_retrieve(self):
+        row = self.client.get('/api/v1/work-items/?include=description').json()['results'][0]
+        detail = self.client.get(f'/api/v1/work-items/{self.item.pk}/').json()
+
+        self.assertEqual(row['description'], self.item.description)
+        self.assertEqual(detail['description'], self.item.description)
+
+
+class DescriptionDerivedColumnsTests(PmsTenantTestCase):
+
+    def test_save_stores_sanitized_html_and_text(self):
+        item = WorkItems.objects.create(
+            title='Ship',
+            description='<p onclick="x()">Ship <b>it</b></p><script>alert(1)</script><p>now</p>',
+            due_date=date(2030, 1, 1),
+        )
+
+        self.assertEqual(item.description_html, '<p>Ship <b>it</b></p><p>now</p>')
+        self.assertEqual(item.description_text, 'Ship it now')
+        self.assertEqual(item.description_excerpt, 'Ship it now')
+
+    def test_update_fields_include_derived_columns(self):
+        item = WorkItems.objects.create(title='Ship', description='<p>old</p>', due_date=date(2030, 1, 1))
+
+        item.description = '<p>new</p>'
+        item.save(update_fields=['description'])
+
+        item.refresh_from_db()
+        self.assertEqual(item.description_text, 'new')
+
+
+class FullTextSearchTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.member = self.create_user('member', 'member')
+        self.project = Project.objects.create(name='Apollo')
+        ProjectMembers.objects.create(project=self.project, user=self.member, role='member')
+        self.hidden = Project.objects.create(name='Gemini')
+        WorkItems.objects.create(
+            title='Release checklist', description='<p>Ship the mobile build</p>',
+            project=self.project, due_date=date(2030, 1, 1),
+        )
+        WorkItems.objects.create(
+            title='Release notes', description='', project=self.hidden, due_date=date(2030, 1, 1),
+        )
+        self.login(self.member)
+
+    def test_search_filter_matches_title_and_description_prefixes(self):
+        for term in ('releas', 'mobile bui'):
+            response = self.client.get('/api/v1/work-items/', {'search': term})
+            titles = [item['title'] for item in response.json()['results']]
+            self.assertEqual(titles, ['Release checklist'], term)
+
+    def test_search_endpoint_is_scoped_and_ranked(self):
+        ProjectActivityLog.objects.create(project=self.project, activity={
+            'branch': 'main', 'repository': 'apollo', 'head_commit': {'message': 'Release v2\n\nWI-1:#done'},
+        })
+        ProjectActivityLog.objects.create(project=self.hidden, activity={
+            'branch': 'main', 'repository': 'gemini', 'head_commit': {'message': 'Release v3'},
+        })
+
+        response = self.client.get('/api/v1/search/', {'q': 'release'})
+
+        results = response.json()['results']
+        self.assertEqual(
+            sorted((result['type'], result['title']) for result in results),
+            [('activity', 'Release v2'), ('work_item', 'Release checklist')],
+        )
+        self.assertEqual(results, sorted(results, key=lambda result: result['rank'], reverse=True))
+
+    def test_query_without_words_returns_nothing(self):
+        response = self.client.get('/api/v1/search/', {'q': "':* & !"})
+
+        self.assertEqual(response.json(), {'results': []})
+
+
+class WorkItemsValuesSerializerParityTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        alice = self.create_user('alice', 'member')
+        bob = self.create_user('bob', 'member')
+        UserProfile.objects.create(user=alice, profile_picture='profile_pics/alice.png')
+        project = Project.objects.create(name='Apollo')
+        first = WorkItems.objects.create(
+            title='Ship', description='<p>Ship <b>it</b></p>', project=project, due_date=date(2030, 1, 1),
+        )
+        first.assigned_to.add(bob, alice)
+        WorkItems.objects.create(title='Unfiled', description='', due_date=date(2030, 2, 1))
+        self.login(self.owner)
+
+    def model_serialized(self, serializer_class, query_string):
+        request = Request(RequestFactory().get(
+            f'/api/v1/work-items/?{query_string}', HTTP_HOST=self.tenant.get_primary_domain().domain,
+        ))
+        queryset = prime_assignees(WorkItems.objects.order_by('-id'))
+        return serializer_class(queryset, many=True, context={'request': request}).data
+
+    def test_list_matches_model_serializers(self):
+        for serializer_class, query_string in (
+            (WorkItemsSummarySerializer, ''),
+            (WorkItemsSerializer, 'include=description'),
+        ):
+            response = self.client.get(f'/api/v1/work-items/?{query_string}')
+
+            self.assertEqual(
+                json.dumps(response.json()['results']),
+                json.dumps(self.model_serialized(serializer_class, query_string)),
+                serializer_class.__name__,
+            )
+
+    def test_assignees_are_loaded_in_one_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/v1/work-items/')
+
+        # The profile join tells the assignee lookup apart from authentication's user query
+        self.assertEqual(len([q for q in ctx.captured_queries if 'user_userprofile' in q['sql']]), 1)
+
+
+class SparseFieldsTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        project = Project.objects.create(name='Apollo')
+        self.item = WorkItems.objects.create(title='Ship', description='', project=project, due_date=date(2030, 1, 1))
+        self.item.assigned_to.add(self.owner)
+        self.login(self.owner)
+
+    def test_list_fields_skip_relations(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/work-items/', {'fields': 'id,title,status'})
+
+        self.assertEqual(response.json()['results'], [{'id': self.item.pk, 'title': 'Ship', 'status': 'pending'}])
+        work_item_queries = [q['sql'] for q in ctx.captured_queries if 'work_items_workitems' in q['sql']]
+        self.assertFalse([sql for sql in work_item_queries if 'project_project' in sql])
+        # No assignee lookup; authentication's own auth_user query does not join profiles
+        self.assertFalse([q for q in ctx.captured_queries if 'user_userprofile' in q['sql']])
+
+    def test_empty_fields_return_every_field(self):
+        row = self.client.get('/api/v1/work-items/', {'fields': ''}).json()['results'][0]
+
+        self.assertIn('assigned_to', row)
+        self.assertIn('title', row)
+
+    def test_unknown_fields_and_includes_are_rejected(self):
+        response = self.client.get('/api/v1/work-items/', {'fields': 'id,nope'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('fields', response.json())
+
+        response = self.client.get(f'/api/v1/work-items/{self.item.pk}/', {'include': 'comments'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('include', response.json())
+
+    def test_retrieve_fields(self):
+        response = self.client.get(f'/api/v1/work-items/{self.item.pk}/', {'fields': 'id,assigned_to'})
+
+        self.assertEqual(list(response.json()), ['id', 'assigned_to'])
+        self.assertEqual(response.json()['assigned_to'][0]['username'], 'owner')
+
+
+class ColumnarFormatTests(PmsTenantTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user('owner', 'owner')
+        self.project = Project.objects.create(name='Apollo')
+        for title in ('Ship', 'Test'):
+            item = WorkItems.objects.create(title=title, description='', project=self.project, due_date=date(2030, 1, 1))
+            item.assigned_to.add(self.owner)
+        self.login(self.owner)
+
+    def test_columns_and_deduplicated_references(self):
+        rows = self.client.get('/api/v1/work-items/').json()
+
+        body = self.client.get('/api/v1/work-items/', {'format': 'columnar'}).json()
+
+        self.assertEqual(body['total_items'], rows['total_items'])
+        self.assertEqual(list(body['results']), list(rows['results'][0]))
+        self.assertEqual(body['results']['title'], [row['title'] for row in rows['results']])
+        self.assertEqual(body['results']['assigned_to'], [[self.owner.pk], [self.owner.pk]])
+        self.assertEqual(body['results']['project'], [self.project.pk, self.project.pk])
+        self.assertEqual(list(body['references']['users']), [str(self.owner.pk)])
+        self.assertEqual(body['references']['projects'][str(self.project.pk)], {'id': self.project.pk, 'name': 'Apollo'})
+
+    def test_detail_is_plain_json(self):
+        item = WorkItems.objects.first()
+
+        body = self.client.get(f'/api/v1/work-items/{item.pk}/', {'format': 'columnar'}).json()
+
+        self.assertEqual(body['id'], item.pk)